@@ -3,8 +3,21 @@ rootCauseAI CLI
 Beautiful command-line interface for error fixing
 """
 
-from .main import app, main
-from .commands import Commands
-from .ui import CliUI
-
 __all__ = ["app", "main", "Commands", "CliUI"]
+
+# Lazy attribute loading (PEP 562) so fast commands like `version`
+# don't pay for the agent/patcher import chain at startup
+_LAZY_IMPORTS = {
+    "app": ".main",
+    "main": ".main",
+    "Commands": ".commands",
+    "CliUI": ".ui",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        module = import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,18 +8,109 @@ from pathlib import Path
 from typing import Optional
 import json
 
-from backend.graph import AgentRunner
 from backend.patcher import SmartPatcher
+from backend.context.cache_manager import CacheManager
 from .ui import CliUI, console
 
+# orjson encodes several times faster than stdlib json; fall back when absent
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
 
 class Commands:
     """CLI command implementations"""
-    
+
+    # Max lines of output kept for error analysis (bounds memory for chatty commands)
+    MAX_OUTPUT_LINES = 500
+
     def __init__(self):
         self.ui = CliUI()
         self.patcher = SmartPatcher()
-    
+        # Reuse runners across calls (watch mode analyzes per save);
+        # keyed by config so provider switches still work
+        self._runners = {}
+        # In-process memo over the disk cache - watch mode re-analyzes
+        # the same error many times within one session
+        self._result_memo = {}
+        # On-disk cache: repeated identical errors skip the LLM entirely
+        self._analysis_cache = CacheManager(
+            cache_dir=str(Path.home() / ".cache" / "rootcauseai" / "fixes")
+        )
+        self._analysis_cache.cache_ttl_hours = 24 * 7
+        # Warm the heavy agent imports (langgraph, LLM SDKs) in the
+        # background so they overlap with user think time instead of
+        # blocking the first analysis
+        import threading
+        threading.Thread(
+            target=lambda: __import__("backend.graph"),
+            daemon=True
+        ).start()
+
+    async def _run_command_async(self, command: str, quiet: bool = False):
+        """
+        Run command without blocking, streaming output as it arrives
+
+        Streams stdout straight to the console while keeping only the
+        last MAX_OUTPUT_LINES of each stream in a bounded ring buffer,
+        so large outputs can't exhaust memory.
+
+        Args:
+            command: Command to run
+            quiet: Don't echo stdout (used for JSON output mode)
+
+        Returns:
+            Tuple of (returncode, stdout_tail, stderr_tail)
+        """
+        import asyncio
+        import re
+        from collections import deque
+
+        # Plain commands skip the shell entirely - no cmd.exe/bash startup
+        has_shell_meta = re.search(r'[|&;<>*?$`"\'\\(){}\[\]~#\n]', command)
+        argv = command.split() if not has_shell_meta else None
+
+        if argv:
+            proc = await asyncio.create_subprocess_exec(
+                *argv,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        else:
+            proc = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+        stdout_ring = deque(maxlen=self.MAX_OUTPUT_LINES)
+        stderr_ring = deque(maxlen=self.MAX_OUTPUT_LINES)
+
+        async def pump(stream, ring, echo: bool):
+            while True:
+                line = await stream.readline()
+                if not line:
+                    break
+                text = line.decode(errors='replace').rstrip('\n')
+                ring.append(text)
+                if echo:
+                    console.print(text, markup=False, highlight=False)
+
+        # Pump both streams concurrently so neither pipe can fill up
+        await asyncio.gather(
+            pump(proc.stdout, stdout_ring, echo=not quiet),
+            pump(proc.stderr, stderr_ring, echo=False)
+        )
+
+        returncode = await proc.wait()
+
+        return returncode, '\n'.join(stdout_ring), '\n'.join(stderr_ring)
+
     def run_command(
         self,
         command: str,
@@ -30,7 +121,7 @@ class Commands:
     ):
         """
         Run a command and auto-fix errors
-        
+
         Args:
             command: Command to run
             provider: LLM provider
@@ -38,31 +129,27 @@ class Commands:
             interactive: Interactive mode
             json_output: Output as JSON
         """
-        import subprocess
-        
+        import asyncio
+
         if not json_output:
             self.ui.print_header("🚀 rootCauseAI - Run & Fix")
             console.print(f"[cyan]Running:[/cyan] {command}\n")
-        
-        # Run command and capture output
+
+        # Run command, streaming output as it arrives
         try:
-            result = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True
+            returncode, stdout_tail, stderr_tail = asyncio.run(
+                self._run_command_async(command, quiet=json_output)
             )
-            
+
             # Check if command succeeded
-            if result.returncode == 0:
+            if returncode == 0:
                 if not json_output:
                     self.ui.print_success("Command executed successfully!")
-                    console.print(result.stdout)
                 return
-            
+
             # Command failed, try to fix
-            error_log = result.stderr or result.stdout
-            
+            error_log = stderr_tail or stdout_tail
+
             if not json_output:
                 console.print("[red]Command failed with error:[/red]")
                 console.print(error_log)
@@ -79,7 +166,7 @@ class Commands:
             
         except Exception as e:
             if json_output:
-                print(json.dumps({"error": str(e)}))
+                print(_dumps({"error": str(e)}))
             else:
                 self.ui.print_error(f"Failed to run command: {e}")
     
@@ -92,16 +179,32 @@ class Commands:
         json_output: bool = False
     ):
         """Analyze error and apply fixes"""
+        # Deferred: pulls in langgraph + LLM SDKs, only needed here
+        from backend.graph import AgentRunner
+
         try:
-            # Run agent
-            runner = AgentRunner(provider=provider, max_retries=max_retries)
-            
-            if not json_output:
-                with console.status("[cyan]Analyzing error...", spinner="dots"):
-                    result = runner.run(error_log)
+            # Check the on-disk cache before paying for an LLM round-trip
+            result = self._load_cached_analysis(error_log)
+
+            if result is not None:
+                if not json_output:
+                    self.ui.print_info("Using cached analysis for this error")
             else:
-                result = runner.run(error_log)
-            
+                # Run agent (cached so repeated analyses reuse LLM clients)
+                runner_key = (provider, max_retries)
+                runner = self._runners.get(runner_key)
+                if runner is None:
+                    runner = AgentRunner(provider=provider, max_retries=max_retries)
+                    self._runners[runner_key] = runner
+
+                if not json_output:
+                    result = self._run_with_live(runner, error_log)
+                else:
+                    result = runner.run(error_log)
+
+                self._store_analysis(error_log, result)
+
+
             # Handle JSON output
             if json_output:
                 output = {
@@ -118,7 +221,7 @@ class Commands:
                             "explanation": fix.explanation
                         })
                 
-                print(json.dumps(output, indent=2))
+                print(_dumps(output))
                 return
             
             # Check status
@@ -147,22 +250,183 @@ class Commands:
                 console.print()
                 self.apply_fixes_interactive(fixes, result["parsed_error"].language)
             else:
-                # Auto-apply in non-interactive mode
-                results = self.patcher.apply_fixes(
-                    fixes=fixes,
-                    language=result["parsed_error"].language,
-                    dry_run=False,
-                    interactive=False
-                )
-                
-                self.ui.print_success(f"Applied {results['applied']} fix(es)")
+                # Auto-apply in non-interactive mode, overlapping patch I/O
+                applied = self.apply_fixes_parallel(fixes, result["parsed_error"].language)
+                self.ui.print_success(f"Applied {applied} fix(es)")
         
         except Exception as e:
             if json_output:
-                print(json.dumps({"error": str(e)}))
+                print(_dumps({"error": str(e)}))
             else:
                 self.ui.print_error(f"Analysis failed: {e}")
     
+    # Friendly labels for the live progress line, keyed by graph node name
+    _STAGE_LABELS = {
+        "parse_error": "Parsing error",
+        "gather_context": "Gathering code context",
+        "analyze_root_cause": "Analyzing root cause",
+        "generate_fixes": "Generating fixes",
+        "validate_fixes": "Validating fixes",
+        "finalize": "Finalizing",
+    }
+
+    @staticmethod
+    def _run_with_live(runner, error_log: str):
+        """
+        Run the agent under a single Live display
+
+        One display updated in place (instead of a spinner torn down and
+        rebuilt per stage) keeps terminal redraws to dirty regions and
+        shows which workflow node is currently executing.
+        """
+        from rich.live import Live
+        from rich.text import Text
+
+        stages_done = []
+
+        with Live(
+            Text("⏳ Analyzing error...", style="cyan"),
+            console=console,
+            refresh_per_second=20,
+            transient=True
+        ) as live:
+            def on_progress(node_name, node_state):
+                label = Commands._STAGE_LABELS.get(node_name, node_name)
+                stages_done.append(label)
+                live.update(Text(
+                    f"⏳ {label}... ({len(stages_done)} step(s) done)",
+                    style="cyan"
+                ))
+
+            try:
+                return runner.run(error_log, on_progress=on_progress)
+            except KeyboardInterrupt:
+                live.update(Text("✋ Cancelled", style="yellow"))
+                raise
+
+    @staticmethod
+    def _error_cache_key(error_log: str) -> str:
+        """
+        Content-addressed cache key for an error log
+
+        Line numbers, memory addresses, and timestamps are normalized
+        away so the same underlying error hits the cache even when
+        incidental details shift between runs.
+        """
+        import hashlib
+        import re
+
+        normalized = re.sub(r'line \d+', 'line N', error_log)
+        normalized = re.sub(r'0x[0-9a-fA-F]+', '0xADDR', normalized)
+        normalized = re.sub(r'\d{4}-\d{2}-\d{2}[T ][\d:.,]+', 'TIMESTAMP', normalized)
+
+        return hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+
+    def _load_cached_analysis(self, error_log: str):
+        """Load a previously cached analysis result, or None"""
+        try:
+            key = self._error_cache_key(error_log)
+
+            # Hot path: already analyzed in this process
+            memoized = self._result_memo.get(key)
+            if memoized is not None:
+                return memoized
+
+            data = self._analysis_cache.get(key)
+            if not data:
+                return None
+
+            # Rebuild the model objects the display/apply paths expect
+            from backend.graph.state import FixSuggestion
+            from backend.parsers.base_parser import ParsedError
+
+            result = dict(data)
+            if result.get("parsed_error"):
+                result["parsed_error"] = ParsedError(**result["parsed_error"])
+            result["final_fixes"] = [
+                FixSuggestion.from_dict(f) for f in result.get("final_fixes") or []
+            ]
+            self._result_memo[key] = result
+            return result
+
+        except Exception:
+            return None
+
+    def _store_analysis(self, error_log: str, result):
+        """Cache a successful analysis result"""
+        if not result or result.get("status") != "success":
+            return
+
+        try:
+            key = self._error_cache_key(error_log)
+            self._result_memo[key] = result
+
+            payload = {
+                "status": result["status"],
+                "execution_time": result.get("execution_time", 0.0),
+                "root_cause_analysis": result.get("root_cause_analysis"),
+                "parsed_error": result["parsed_error"].dict() if result.get("parsed_error") else None,
+                "final_fixes": [f.dict() for f in result.get("final_fixes") or []],
+            }
+            self._analysis_cache.set(key, payload)
+        except Exception:
+            pass  # Caching is best-effort
+
+    def apply_fixes_parallel(self, fixes, language: str) -> int:
+        """
+        Apply fixes concurrently with a worker pool
+
+        Fixes are grouped by target file: distinct files overlap their
+        read/diff/write round-trips in the pool, while fixes sharing a
+        file run sequentially inside one worker so each patch lands on
+        the previous one's output instead of a stale copy (concurrent
+        whole-file rewrites would silently drop all but the last).
+        Results are printed after the pool drains so worker output
+        doesn't interleave. History writes are serialized by the
+        tracker's internal lock.
+
+        Args:
+            fixes: List of fix suggestions
+            language: Programming language
+
+        Returns:
+            Number of fixes applied
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        groups: dict = {}
+        for fix in fixes:
+            groups.setdefault(fix.file_path, []).append(fix)
+
+        def apply_group(group):
+            outcomes = []
+            for fix in group:
+                success, message = self.patcher.applier.apply_patch(
+                    file_path=fix.file_path,
+                    original_snippet=fix.original_snippet,
+                    new_snippet=fix.new_snippet,
+                    language=language,
+                    dry_run=False
+                )
+                outcomes.append((fix, success, message))
+            return outcomes
+
+        group_list = list(groups.values())
+        with ThreadPoolExecutor(max_workers=min(8, len(group_list))) as executor:
+            all_outcomes = list(executor.map(apply_group, group_list))
+
+        applied = 0
+        for outcomes in all_outcomes:
+            for fix, success, message in outcomes:
+                name = Path(fix.file_path).name
+                if success:
+                    applied += 1
+                    console.print(f"[green]✅ {name}: {message}[/green]")
+                else:
+                    console.print(f"[red]❌ {name}: {message}[/red]")
+
+        return applied
+
     def apply_fixes_interactive(self, fixes, language: str):
         """Apply fixes with interactive confirmation"""
         for i, fix in enumerate(fixes, 1):
@@ -189,26 +453,50 @@ class Commands:
             else:
                 self.ui.print_info("Skipped")
     
-    def explain_command(self, log_file: str, json_output: bool = False):
-        """Explain error from log file"""
+    def explain_command(
+        self,
+        log_file_or_text: str,
+        json_output: bool = False,
+        is_text: bool = False
+    ):
+        """
+        Explain error from a log file or raw error text
+
+        Args:
+            log_file_or_text: Path to log file, or the error text itself
+            json_output: Output as JSON
+            is_text: Treat the first argument as error text, not a path
+        """
+        from backend.graph import AgentRunner
+
         try:
-            # Read log file
-            error_log = Path(log_file).read_text()
-            
+            # Get error log (no tempfile round-trip for raw text)
+            if is_text:
+                error_log = log_file_or_text
+            else:
+                error_log = Path(log_file_or_text).read_text(encoding="utf-8")
+
+
             if not json_output:
                 self.ui.print_header("🔍 rootCauseAI - Explain Error")
-            
-            # Analyze
-            runner = AgentRunner(max_retries=1)
-            result = runner.run(error_log)
-            
+
+            # Reuse a prior analysis of this error (run/fix in this
+            # session, or the disk cache) instead of re-parsing via LLM
+            result = self._load_cached_analysis(error_log)
+
+            if result is None:
+                runner = AgentRunner(max_retries=1)
+                result = runner.run(error_log)
+                self._store_analysis(error_log, result)
+
+
             if json_output:
                 output = {
                     "status": result["status"],
                     "parsed_error": result.get("parsed_error").dict() if result.get("parsed_error") else None,
                     "root_cause": result.get("root_cause_analysis")
                 }
-                print(json.dumps(output, indent=2))
+                print(_dumps(output))
             else:
                 if result.get("parsed_error"):
                     parsed = result["parsed_error"]
@@ -223,7 +511,7 @@ class Commands:
         
         except Exception as e:
             if json_output:
-                print(json.dumps({"error": str(e)}))
+                print(_dumps({"error": str(e)}))
             else:
                 self.ui.print_error(f"Failed: {e}")
     
@@ -7,6 +7,12 @@ from rich.prompt import Prompt, Confirm
 from .ui import CliUI, console
 import yaml
 
+# Prefer libyaml's C dumper when available (pure-Python fallback otherwise)
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
 
 class ConfigCLI:
     """Interactive configuration setup"""
@@ -61,7 +67,7 @@ class ConfigCLI:
         
         # Save config
         with open(self.config_file, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yaml.dump(config, f, Dumper=_YamlDumper, default_flow_style=False)
         
         self.ui.print_success(f"Configuration saved to {self.config_file}")
         
@@ -98,28 +98,17 @@ def explain(
     """
     from backend.cli.commands import Commands
     commands = Commands()
-    
-    # Get error log
+
+    # Get error log (raw text goes straight through - no tempfile)
     if file:
-        error_text = file
+        commands.explain_command(file, json_output=json_output)
     elif error_log:
-        # Save to temp file
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-            f.write(error_log)
-            error_text = f.name
+        commands.explain_command(error_log, json_output=json_output, is_text=True)
+    elif not sys.stdin.isatty():
+        commands.explain_command(sys.stdin.read(), json_output=json_output, is_text=True)
     else:
-        if not sys.stdin.isatty():
-            import tempfile
-            content = sys.stdin.read()
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.txt') as f:
-                f.write(content)
-                error_text = f.name
-        else:
-            print("❌ Please provide error log")
-            raise typer.Exit(1)
-    
-    commands.explain_command(error_text, json_output=json_output)
+        print("❌ Please provide error log")
+        raise typer.Exit(1)
 
 
 @app.command()
@@ -161,19 +150,20 @@ def stats():
 
 
 @app.command()
-def watch(path: str = "."):
+def watch(path: str = ".", execute: bool = False):
     """
     👀 Watch mode - auto-fix errors on file changes
-    
+
     Examples:
         fix-error watch
         fix-error watch ./src
+        fix-error watch --execute   # also run scripts to catch runtime errors
     """
     from backend.cli.commands import Commands
     from backend.cli.watch import watch_mode
-    
+
     commands = Commands()
-    watch_mode(path, commands)
+    watch_mode(path, commands, execute=execute)
 
 
 @app.command()
@@ -193,11 +183,9 @@ def version():
     """
     📦 Show version information
     """
-    from rich.console import Console
     from rich.panel import Panel
-    
-    console = Console()
-    
+    from backend.cli.ui import console
+
     console.print(Panel.fit(
         "[bold cyan]rootCauseAI v0.1.0[/bold cyan]",
         border_style="cyan"
@@ -213,8 +201,25 @@ def version():
         console.print("[yellow]⚠️  No configuration found. Run: fix-error config[/yellow]")
 
 
+# Simple commands that take no required arguments - these can run
+# without paying for Click's full command-tree construction
+_FAST_COMMANDS = {
+    "version": version,
+    "stats": stats,
+    "history": history,
+    "undo": undo,
+}
+
+
 def main():
     """Entry point for CLI"""
+    # Fast path: bare simple command, no flags to parse
+    if len(sys.argv) == 2 and sys.argv[1] in _FAST_COMMANDS:
+        _FAST_COMMANDS[sys.argv[1]]()
+        return
+
+    # Anything with options, help, or the complex commands goes
+    # through the full Typer app
     app()
 
 
@@ -6,15 +6,27 @@ Beautiful terminal interface with Rich
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.syntax import Syntax
 from rich.prompt import Confirm, Prompt
-from rich.tree import Tree
 from typing import List, Optional
+from functools import lru_cache
 import time
 
 console = Console()
 
+SYNTAX_THEME = "monokai"
+
+
+@lru_cache(maxsize=16)
+def _lexer(language: str):
+    """Cache pygments lexers so repeated diff renders skip the registry lookup"""
+    from pygments.lexers import get_lexer_by_name
+
+    try:
+        return get_lexer_by_name(language)
+    except Exception:
+        # Unknown alias - hand the name to Rich and let it resolve
+        return language
+
 
 class CliUI:
     """Rich terminal UI components"""
@@ -50,6 +62,8 @@ class CliUI:
     @staticmethod
     def show_progress(description: str, total: Optional[int] = None):
         """Show progress bar"""
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -61,11 +75,15 @@ class CliUI:
     @staticmethod
     def show_code_diff(original: str, fixed: str, language: str = "python"):
         """Show code diff with syntax highlighting"""
+        from rich.syntax import Syntax
+
+        lexer = _lexer(language)
+
         console.print("\n[red]- Original:[/red]")
-        console.print(Syntax(original, language, theme="monokai", line_numbers=True))
-        
+        console.print(Syntax(original, lexer, theme=SYNTAX_THEME, line_numbers=True))
+
         console.print("\n[green]+ Fixed:[/green]")
-        console.print(Syntax(fixed, language, theme="monokai", line_numbers=True))
+        console.print(Syntax(fixed, lexer, theme=SYNTAX_THEME, line_numbers=True))
     
     @staticmethod
     def confirm(question: str, default: bool = True) -> bool:
@@ -80,22 +98,30 @@ class CliUI:
     @staticmethod
     def show_fix_table(fixes: List[dict]):
         """Show fixes in a table"""
+        import shutil
+
         table = Table(title="Generated Fixes", show_header=True, header_style="bold cyan")
-        
+
         table.add_column("#", style="dim", width=3)
         table.add_column("File", style="cyan")
         table.add_column("Confidence", style="yellow", justify="right")
-        table.add_column("Explanation", style="white")
-        
+        # Let Rich ellipsize to the terminal instead of hard-slicing at 50 chars
+        table.add_column(
+            "Explanation",
+            style="white",
+            overflow="ellipsis",
+            no_wrap=True,
+            max_width=max(20, shutil.get_terminal_size().columns - 40)
+        )
+
         for i, fix in enumerate(fixes, 1):
-            confidence = f"{fix.confidence * 100:.0f}%"
             table.add_row(
                 str(i),
                 fix.file_path,
-                confidence,
-                fix.explanation[:50] + "..." if len(fix.explanation) > 50 else fix.explanation
+                f"{fix.confidence * 100:.0f}%",
+                fix.explanation
             )
-        
+
         console.print(table)
     
     @staticmethod
@@ -122,15 +148,22 @@ class CliUI:
         table.add_column("Timestamp", style="green")
         table.add_column("Status", style="magenta")
         
-        for fix in history:
-            status = "🔴 Reverted" if fix.get('reverted') else "✅ Active"
-            table.add_row(
+        # Build rows up front and bind add_row locally - keeps the
+        # per-row overhead down for large --count values
+        rows = [
+            (
                 fix['fix_id'],
                 fix['file_path'],
                 fix['timestamp'][:19],
-                status
+                "🔴 Reverted" if fix.get('reverted') else "✅ Active"
             )
-        
+            for fix in history
+        ]
+
+        add_row = table.add_row
+        for row in rows:
+            add_row(*row)
+
         console.print(table)
     
     @staticmethod
@@ -2,78 +2,263 @@
 Watch Mode - Continuous Error Monitoring
 """
 
+import os
+import sys
 import time
+import threading
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import PatternMatchingEventHandler
 from .ui import CliUI, console
 from .commands import Commands
 
+# Resolved once: spawn checks with the running interpreter and a trimmed
+# environment (Windows copies the whole env block per CreateProcess)
+_PY = sys.executable
+_MIN_ENV = {
+    "PATH": os.environ.get("PATH", ""),
+    "PYTHONIOENCODING": "utf-8",
+    "PYTHONUNBUFFERED": "1",
+}
+if os.name == "nt" and "SYSTEMROOT" in os.environ:
+    _MIN_ENV["SYSTEMROOT"] = os.environ["SYSTEMROOT"]
 
-class ErrorWatcher(FileSystemEventHandler):
+# Filesystems where inotify doesn't work reliably - poll instead
+NETWORK_FS_TYPES = {"nfs", "nfs4", "cifs", "smbfs", "sshfs", "fuse.sshfs"}
+
+
+def _is_network_fs(path: str) -> bool:
+    """Check whether path lives on a network filesystem"""
+    try:
+        resolved = str(Path(path).resolve())
+        best_mount = ""
+        fs_type = None
+
+        with open("/proc/mounts") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) < 3:
+                    continue
+                mount_point, mount_fs = parts[1], parts[2]
+                # Longest matching mount point wins
+                if resolved.startswith(mount_point) and len(mount_point) > len(best_mount):
+                    best_mount, fs_type = mount_point, mount_fs
+
+        return fs_type in NETWORK_FS_TYPES
+    except Exception:
+        # No /proc/mounts (macOS, Windows) - assume local
+        return False
+
+
+def capture_bounded(cmd, max_lines: int = 500, timeout: int = 5, env=None):
+    """
+    Run a command keeping only the last max_lines of each stream
+
+    Unlike subprocess.run(capture_output=True), memory stays bounded
+    even when the process floods stdout/stderr with megabytes of spam.
+
+    Args:
+        cmd: Command and arguments list
+        max_lines: Lines of output to retain per stream
+        timeout: Seconds before the process is killed
+        env: Optional environment for the child process
+
+    Returns:
+        Tuple of (returncode, stdout_tail, stderr_tail)
+
+    Raises:
+        subprocess.TimeoutExpired: If the process exceeds the timeout
+    """
+    from collections import deque
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        env=env
+    )
+
+    stdout_ring = deque(maxlen=max_lines)
+    stderr_ring = deque(maxlen=max_lines)
+
+    def drain(stream, ring):
+        for line in stream:
+            ring.append(line.rstrip('\n'))
+
+    # Drain both pipes in threads so neither can fill up and deadlock
+    threads = [
+        threading.Thread(target=drain, args=(proc.stdout, stdout_ring), daemon=True),
+        threading.Thread(target=drain, args=(proc.stderr, stderr_ring), daemon=True),
+    ]
+    for t in threads:
+        t.start()
+
+    try:
+        returncode = proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        raise
+
+    for t in threads:
+        t.join(timeout=1)
+
+    return returncode, '\n'.join(stdout_ring), '\n'.join(stderr_ring)
+
+
+class ErrorWatcher(PatternMatchingEventHandler):
     """Watch for file changes and auto-fix errors"""
-    
-    def __init__(self, commands: Commands):
+
+    # Editors emit several FS events per save; coalesce them per file
+    DEBOUNCE_SECONDS = 0.3
+
+    def __init__(self, commands: Commands, execute: bool = False):
+        # Filter in the handler library so vendored/VCS trees never
+        # reach our Python callback
+        super().__init__(
+            patterns=["*.py", "*.js", "*.ts"],
+            ignore_patterns=[
+                "*/.git/*",
+                "*/node_modules/*",
+                "*/__pycache__/*",
+                "*/.fix-error-backup/*",
+                "*/.fix-error-cache/*",
+            ],
+            ignore_directories=True,
+        )
         self.commands = commands
+        self.execute = execute  # Run scripts to catch runtime errors (opt-in)
         self.ui = CliUI()
-    
+        self._timers: dict[Path, threading.Timer] = {}
+        self._timers_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        # Checks run in parallel, but analysis drives a rich Live
+        # display on the shared console - a second concurrent
+        # analyze_and_fix would die with "Only one live display may be
+        # active at once", dropping that error. Queue it instead.
+        self._analysis_lock = threading.Lock()
+
     def on_modified(self, event):
         """Handle file modification"""
-        if event.is_directory:
-            return
-        
-        file_path = Path(event.src_path)
-        
-        # Only watch Python files
-        if file_path.suffix not in ['.py', '.js', '.ts']:
-            return
-        
+        self._schedule_check(Path(event.src_path))
+
+    def _schedule_check(self, file_path: Path):
+        """Debounce: restart the per-file timer on every event"""
+        with self._timers_lock:
+            timer = self._timers.get(file_path)
+            if timer:
+                timer.cancel()
+
+            timer = threading.Timer(
+                self.DEBOUNCE_SECONDS,
+                self._run_check,
+                args=(file_path,)
+            )
+            timer.daemon = True
+            self._timers[file_path] = timer
+            timer.start()
+
+    def _run_check(self, file_path: Path):
+        """Run the check once the debounce window closes"""
+        with self._timers_lock:
+            self._timers.pop(file_path, None)
+
         console.print(f"\n[cyan]File changed:[/cyan] {file_path}")
-        
-        # Try to run the file
+
+        # This process lives across many edits; drop the memoized
+        # import resolutions so files created since the last analysis
+        # show up in context gathering
+        from backend.context.import_analyzer import clear_resolution_caches
+        clear_resolution_caches()
+
+        # Try to run the file (distinct files check in parallel)
         if file_path.suffix == '.py':
-            self.check_python_file(file_path)
-    
+            self._executor.submit(self.check_python_file, file_path)
+
     def check_python_file(self, file_path: Path):
         """Check Python file for errors"""
+        # Cheap in-process syntax check first - no interpreter startup,
+        # no side effects from actually running the script
+        if self._static_check(file_path):
+            return
+
+        # Static check passed; only execute the script when asked to
+        if not self.execute:
+            return
+
         try:
-            result = subprocess.run(
-                ["python", str(file_path)],
-                capture_output=True,
-                text=True,
-                timeout=5
+            returncode, _, stderr_tail = capture_bounded(
+                [_PY, str(file_path)],
+                max_lines=500,
+                timeout=5,
+                env=_MIN_ENV
             )
-            
-            if result.returncode != 0:
-                error_log = result.stderr
+
+            if returncode != 0:
                 console.print("[yellow]Error detected! Analyzing...[/yellow]")
-                
-                self.commands.analyze_and_fix(
-                    error_log,
-                    interactive=False,
-                    json_output=False
-                )
-        
+
+                with self._analysis_lock:
+                    self.commands.analyze_and_fix(
+                        stderr_tail,
+                        interactive=False,
+                        json_output=False
+                    )
+
+
         except subprocess.TimeoutExpired:
             console.print("[yellow]Script timeout (might be running server)[/yellow]")
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
 
+    def _static_check(self, file_path: Path) -> bool:
+        """
+        Compile the file in-process to catch syntax errors
 
-def watch_mode(path: str = ".", commands: Commands = None):
+        Returns:
+            True if an error was found (and sent for analysis)
+        """
+        import py_compile
+
+        try:
+            py_compile.compile(str(file_path), doraise=True)
+            return False
+        except py_compile.PyCompileError as e:
+            console.print("[yellow]Error detected! Analyzing...[/yellow]")
+
+            with self._analysis_lock:
+                self.commands.analyze_and_fix(
+                    str(e),
+                    interactive=False,
+                    json_output=False
+                )
+            return True
+        except Exception:
+            # File vanished mid-check, unreadable, etc. - nothing to report
+            return False
+
+
+def watch_mode(path: str = ".", commands: Commands = None, execute: bool = False):
     """Start watch mode"""
     if commands is None:
         commands = Commands()
-    
+
     ui = CliUI()
     ui.print_header("👀 rootCauseAI - Watch Mode")
-    
+
     console.print(f"\n[cyan]Watching:[/cyan] {path}")
     console.print("[yellow]Press Ctrl+C to stop[/yellow]\n")
-    
-    event_handler = ErrorWatcher(commands)
-    observer = Observer()
+
+    event_handler = ErrorWatcher(commands, execute=execute)
+
+    # inotify misses events on network mounts; fall back to polling there
+    if _is_network_fs(path):
+        from watchdog.observers.polling import PollingObserver
+        observer = PollingObserver()
+    else:
+        observer = Observer()
     observer.schedule(event_handler, path, recursive=True)
     observer.start()
     
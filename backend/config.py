@@ -6,10 +6,17 @@ Loads settings from YAML file or environment variables
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Literal, Optional
+from functools import lru_cache
 import yaml
 from pathlib import Path
 import os
 
+# Prefer libyaml's C loader when available (pure-Python fallback otherwise)
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class Settings(BaseSettings):
     """Application settings with validation"""
@@ -80,7 +87,7 @@ class Settings(BaseSettings):
         if Path(config_path).exists():
             try:
                 with open(config_path, 'r') as f:
-                    yaml_data = yaml.safe_load(f) or {}
+                    yaml_data = yaml.load(f, Loader=_YamlLoader) or {}
                     # Create settings from YAML data
                     return cls(**yaml_data)
             except Exception as e:
@@ -133,5 +140,23 @@ class Settings(BaseSettings):
             raise ValueError(f"Unknown provider: {provider}")
 
 
-# Global settings instance
-settings = Settings.from_yaml()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the global settings instance (loaded once per process)
+
+    YAML parsing and pydantic validation only happen on first access,
+    so commands that never touch settings don't pay for them.
+
+    Returns:
+        Cached Settings instance
+    """
+    return Settings.from_yaml()
+
+
+def __getattr__(name):
+    # Keep `from backend.config import settings` working without paying
+    # the YAML parse at import time (PEP 562 lazy module attribute)
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
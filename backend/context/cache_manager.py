@@ -3,132 +3,242 @@ Cache Manager
 Caches context for repeated errors to improve performance
 """
 
-import json
 import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Tuple
+
+# orjson parses/serializes several times faster than stdlib json and
+# writes compact output; fall back to stdlib when it isn't installed
+try:
+    import orjson
+
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    import json
+
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# msgpack skips JSON's string escaping entirely - context payloads are
+# mostly source text, so it's the fastest format when available. New
+# entries carry a one-byte magic so JSON-era blobs still read fine.
+_MSGPACK_MAGIC = b"M"
+
+try:
+    import msgpack
+
+    def _loads(raw: bytes):
+        if raw[:1] == _MSGPACK_MAGIC:
+            return msgpack.unpackb(raw[1:], raw=False)
+        return _json_loads(raw)
+
+    def _dumps(obj) -> bytes:
+        return _MSGPACK_MAGIC + msgpack.packb(obj, use_bin_type=True)
+except ImportError:
+    _loads, _dumps = _json_loads, _json_dumps
 
 
 class CacheManager:
     """
     Manages cache for error contexts to avoid re-processing
+
+    Entries live in a single SQLite database rather than one file per
+    key: lookups are B-tree indexed, expiry is one DELETE, and the cache
+    doesn't accumulate thousands of inodes.
     """
-    
+
     def __init__(self, cache_dir: str = ".fix-error-cache"):
         """
         Initialize cache manager
-        
+
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory to store the cache database
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
         # Cache settings
         self.cache_ttl_hours = 24  # Cache expires after 24 hours
-    
+
+        # In-memory LRU in front of the database - hot keys skip the
+        # query and decode entirely
+        self._mem: OrderedDict[str, Tuple[float, Dict]] = OrderedDict()
+        self._mem_maxsize = 1000
+
+        # Connection is opened lazily; the lock serializes access from
+        # watch-mode worker threads
+        self._db_path = self.cache_dir / "cache.db"
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        """Open (once) and return the cache database connection"""
+        if self._conn is None:
+            conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, ts REAL, blob BLOB)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_ts ON cache(ts)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
     def _generate_key(self, error_log: str, file_path: str) -> str:
         """
         Generate cache key from error and file
-        
+
         Args:
             error_log: Error log text
             file_path: Path to error file
-            
+
         Returns:
             Cache key (hash)
         """
-        # Combine error signature with file path
-        combined = f"{error_log[:500]}:{file_path}"
-        return hashlib.sha256(combined.encode()).hexdigest()[:16]
-    
+        # BLAKE2b is faster than SHA-256 for short inputs, and 64 bits
+        # is plenty for a local cache key; feeding the parts via
+        # update() skips building an intermediate concatenated string
+        h = hashlib.blake2b(digest_size=8)
+        h.update(error_log[:500].encode())
+        h.update(b":")
+        h.update(file_path.encode())
+        return h.hexdigest()
+
     def get(self, cache_key: str) -> Optional[Dict]:
         """
         Retrieve cached context
-        
+
         Args:
             cache_key: Cache key
-            
+
         Returns:
             Cached data or None if expired/not found
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        
-        if not cache_file.exists():
-            return None
-        
+        ttl_seconds = self.cache_ttl_hours * 3600
+        now = time.time()
+
+        # Hot path: in-memory hit, no query
+        entry = self._mem.get(cache_key)
+        if entry is not None:
+            cached_time, context = entry
+            if now - cached_time <= ttl_seconds:
+                self._mem.move_to_end(cache_key)
+                return context
+            del self._mem[cache_key]
+
         try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-            
-            # Check if cache is expired
-            cached_time = datetime.fromisoformat(data.get("timestamp", ""))
-            if datetime.now() - cached_time > timedelta(hours=self.cache_ttl_hours):
-                # Cache expired, delete it
-                cache_file.unlink()
+            with self._db_lock:
+                row = self._db().execute(
+                    "SELECT ts, blob FROM cache WHERE key = ? AND ts > ?",
+                    (cache_key, now - ttl_seconds)
+                ).fetchone()
+
+            if row is None:
                 return None
-            
-            return data.get("context")
-            
+
+            cached_time, blob = row
+            context = _loads(blob)
+            self._mem_insert(cache_key, cached_time, context)
+            return context
+
         except Exception:
             return None
-    
+
+    def _mem_insert(self, cache_key: str, cached_time: float, context: Dict):
+        """Insert into the in-memory LRU, evicting the oldest entry if full"""
+        self._mem[cache_key] = (cached_time, context)
+        self._mem.move_to_end(cache_key)
+        if len(self._mem) > self._mem_maxsize:
+            self._mem.popitem(last=False)
+
     def set(self, cache_key: str, context_data: Dict):
         """
         Store context in cache
-        
+
         Args:
             cache_key: Cache key
             context_data: Context data to cache
         """
-        cache_file = self.cache_dir / f"{cache_key}.json"
-        
         try:
-            data = {
-                "timestamp": datetime.now().isoformat(),
-                "context": context_data
-            }
-            
-            with open(cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+            now = time.time()
+            self._mem_insert(cache_key, now, context_data)
+
+            blob = _dumps(context_data)
+            with self._db_lock:
+                conn = self._db()
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, ts, blob) VALUES (?, ?, ?)",
+                    (cache_key, now, blob)
+                )
+                conn.commit()
+
         except Exception:
             pass  # Silently fail if can't cache
-    
+
     def clear(self):
         """Clear all cached data"""
+        self._mem.clear()
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                cache_file.unlink()
+            with self._db_lock:
+                conn = self._db()
+                conn.execute("DELETE FROM cache")
+                conn.commit()
+
+            # Sweep any leftover per-entry files from older versions
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".json"):
+                        os.unlink(entry.path)
         except Exception:
             pass
-    
+
     def clear_expired(self):
         """Clear only expired cache entries"""
+        ttl_seconds = self.cache_ttl_hours * 3600
+        now = time.time()
+
+        for key in [k for k, (ts, _) in self._mem.items() if now - ts > ttl_seconds]:
+            del self._mem[key]
+
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    with open(cache_file, 'r') as f:
-                        data = json.load(f)
-                    
-                    cached_time = datetime.fromisoformat(data.get("timestamp", ""))
-                    if datetime.now() - cached_time > timedelta(hours=self.cache_ttl_hours):
-                        cache_file.unlink()
-                        
-                except Exception:
-                    continue
+            # One indexed DELETE instead of a per-file sweep
+            with self._db_lock:
+                conn = self._db()
+                conn.execute("DELETE FROM cache WHERE ts < ?", (now - ttl_seconds,))
+                conn.commit()
         except Exception:
             pass
-    
+
     def get_cache_stats(self) -> Dict:
         """Get cache statistics"""
-        total_files = len(list(self.cache_dir.glob("*.json")))
-        total_size = sum(f.stat().st_size for f in self.cache_dir.glob("*.json"))
-        
+        total_entries = 0
+        total_size = 0
+        try:
+            with self._db_lock:
+                row = self._db().execute(
+                    "SELECT COUNT(*), COALESCE(SUM(LENGTH(blob)), 0) FROM cache"
+                ).fetchone()
+            total_entries, total_size = row
+        except Exception:
+            pass
+
         return {
             "cache_dir": str(self.cache_dir),
-            "total_entries": total_files,
+            "total_entries": total_entries,
             "total_size_bytes": total_size,
             "total_size_mb": round(total_size / (1024 * 1024), 2)
         }
@@ -3,8 +3,38 @@ Config File Detector
 Finds relevant configuration files in the project
 """
 
+import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+# orjson parses package.json noticeably faster; fall back to stdlib
+try:
+    import orjson
+
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+except ImportError:
+    import json
+
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+
+# Memoized discovery results keyed by (project_root, language); the
+# root directory's mtime invalidates the entry when files come or go
+_found_cache: Dict[Tuple[str, Optional[str]], Tuple[float, List[str]]] = {}
+
+# (marker, framework) pairs scanned in order - first hit wins
+_PYTHON_FRAMEWORKS = (
+    ("django", "django"),
+    ("flask", "flask"),
+    ("fastapi", "fastapi"),
+)
+_JS_FRAMEWORKS = (
+    ("react", "react"),
+    ("vue", "vue"),
+    ("next", "nextjs"),
+    ("express", "express"),
+)
 
 
 class ConfigDetector:
@@ -63,7 +93,20 @@ class ConfigDetector:
         """
         found_files = []
         root_path = Path(project_root)
-        
+
+        # Configs change rarely - reuse the last scan while the root
+        # directory's mtime is unchanged
+        cache_key = (str(root_path), language)
+        try:
+            root_mtime = os.stat(root_path).st_mtime
+        except OSError:
+            root_mtime = None
+
+        if root_mtime is not None:
+            cached = _found_cache.get(cache_key)
+            if cached is not None and cached[0] == root_mtime:
+                return list(cached[1])
+
         # Determine which config files to look for
         if language:
             config_files = ConfigDetector.CONFIG_FILES.get(language, [])
@@ -74,12 +117,21 @@ class ConfigDetector:
             for file_list in ConfigDetector.CONFIG_FILES.values():
                 config_files.extend(file_list)
         
-        # Search for files
-        for config_file in config_files:
-            file_path = root_path / config_file
-            if file_path.exists() and file_path.is_file():
-                found_files.append(str(file_path))
-        
+        # One directory listing beats a stat per candidate name;
+        # DirEntry.is_file() reads the dirent type, no extra syscall
+        try:
+            with os.scandir(root_path) as it:
+                present = {entry.name for entry in it if entry.is_file()}
+        except OSError:
+            present = set()
+
+        found_files = [
+            str(root_path / name) for name in config_files if name in present
+        ]
+
+        if root_mtime is not None:
+            _found_cache[cache_key] = (root_mtime, list(found_files))
+
         return found_files
     
     @staticmethod
@@ -121,40 +173,33 @@ class ConfigDetector:
             Framework name or None
         """
         root_path = Path(project_root)
-        
-        # Check Python frameworks
+
+        # Check Python frameworks (ordered tuple, first hit wins)
         requirements_file = root_path / "requirements.txt"
         if requirements_file.exists():
             try:
                 with open(requirements_file, 'r') as f:
                     content = f.read().lower()
-                    if 'django' in content:
-                        return 'django'
-                    elif 'flask' in content:
-                        return 'flask'
-                    elif 'fastapi' in content:
-                        return 'fastapi'
+                for marker, framework in _PYTHON_FRAMEWORKS:
+                    if marker in content:
+                        return framework
             except:
                 pass
-        
-        # Check JavaScript frameworks
+
+        # Check JavaScript frameworks (no dict merge - probe both maps)
         package_json = root_path / "package.json"
         if package_json.exists():
             try:
-                import json
-                with open(package_json, 'r') as f:
-                    data = json.load(f)
-                    deps = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
-                    
-                    if 'react' in deps:
-                        return 'react'
-                    elif 'vue' in deps:
-                        return 'vue'
-                    elif 'next' in deps:
-                        return 'nextjs'
-                    elif 'express' in deps:
-                        return 'express'
+                with open(package_json, 'rb') as f:
+                    data = _json_loads(f.read())
+
+                deps = data.get('dependencies', {})
+                dev_deps = data.get('devDependencies', {})
+
+                for marker, framework in _JS_FRAMEWORKS:
+                    if marker in deps or marker in dev_deps:
+                        return framework
             except:
                 pass
-        
+
         return None
@@ -3,6 +3,7 @@ Context Builder
 Orchestrates all context gathering components
 """
 
+import os
 from typing import List, Optional
 from pydantic import BaseModel, Field
 from pathlib import Path
@@ -14,6 +15,14 @@ from .git_analyzer import GitAnalyzer
 from .config_detector import ConfigDetector
 from .token_manager import TokenManager
 
+# Configs surfaced first when the token budget forces a cut
+_PRIORITY_CONFIGS = frozenset({
+    "package.json",
+    "requirements.txt",
+    "pyproject.toml",
+    "tsconfig.json",
+})
+
 
 class FileContext(BaseModel):
     """Represents context from a single file"""
@@ -127,22 +136,33 @@ class ContextBuilder:
     def _gather_primary_files(self, parsed_error: ParsedError) -> List[FileContext]:
         """Gather files where error occurred"""
         primary_files = []
-        
+
         # Get top 3 stack frames (most relevant)
-        for frame in parsed_error.stack_frames[:3]:
-            if not FileReader.file_exists(frame.file_path):
+        frames = parsed_error.stack_frames[:3]
+
+        # One batched git lookup for all frames instead of several
+        # subprocess spawns per file
+        frame_paths = [f.file_path for f in frames if FileReader.file_exists(f.file_path)]
+        git_info = GitAnalyzer.batch_log_and_diff(frame_paths, limit=3) if frame_paths else {}
+
+        # Read the frame windows concurrently (pure I/O, GIL released);
+        # token-budget accounting stays serial below so can_add is
+        # consistent
+        if len(frames) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=len(frames)) as pool:
+                windows = list(pool.map(self._read_frame_window, frames))
+        else:
+            windows = [self._read_frame_window(frame) for frame in frames]
+
+        for frame, context_data in zip(frames, windows):
+            if context_data is None:
                 continue
-            
+
             try:
-                # Get code around error line
-                context_data = FileReader.get_lines_around(
-                    frame.file_path,
-                    frame.line,
-                    context_lines=15  # ±15 lines
-                )
-                
                 content = context_data["content"]
-                
+
                 # Check if we can add this file
                 if not self.token_manager.can_add(content):
                     # Try with fewer lines
@@ -156,14 +176,10 @@ class ContextBuilder:
                     if not self.token_manager.can_add(content):
                         continue  # Skip if still too large
                 
-                # Get git information
-                git_diff = None
-                recent_commits = None
-                
-                if GitAnalyzer.is_git_repo(Path(frame.file_path).parent):
-                    git_diff = GitAnalyzer.get_recent_changes(frame.file_path, max_lines=30)
-                    recent_commits = GitAnalyzer.get_recent_commits(frame.file_path, limit=3)
-                
+                # Get git information (from the batched lookup above)
+                git_diff, recent_commits = git_info.get(frame.file_path, (None, []))
+                recent_commits = recent_commits or None
+
                 # Create file context
                 file_context = FileContext(
                     file_path=frame.file_path,
@@ -187,7 +203,21 @@ class ContextBuilder:
                 continue
         
         return primary_files
-    
+
+    @staticmethod
+    def _read_frame_window(frame) -> Optional[dict]:
+        """Read the ±15 line window around one stack frame, or None"""
+        try:
+            if not FileReader.file_exists(frame.file_path):
+                return None
+            return FileReader.get_lines_around(
+                frame.file_path,
+                frame.line,
+                context_lines=15
+            )
+        except Exception:
+            return None
+
     def _gather_related_files(self, parsed_error: ParsedError) -> List[FileContext]:
         """Gather related files through import analysis"""
         related_files = []
@@ -202,10 +232,13 @@ class ContextBuilder:
             return related_files
         
         try:
-            # Build import chain (depth=1 to avoid too many files)
+            # Build import chain (depth=1 to avoid too many files;
+            # limit=4 stops resolution once 3 related files + the main
+            # file are found, since only 3 are used below)
             import_chain = ImportAnalyzer.build_import_chain(
                 main_file,
-                max_depth=1
+                max_depth=1,
+                limit=4
             )
             
             # Remove main file from chain
@@ -230,7 +263,8 @@ class ContextBuilder:
                     file_context = FileContext(
                         file_path=related_path,
                         start_line=1,
-                        end_line=min(50, len(content.split('\n'))),
+                        # count('\n') avoids materializing a list of lines
+                        end_line=min(50, content.count('\n') + (0 if content.endswith('\n') else 1)),
                         content=content,
                         is_primary=False
                     )
@@ -256,21 +290,14 @@ class ContextBuilder:
             language=language
         )
         
-        # Prioritize important configs
-        priority_configs = [
-            "package.json",
-            "requirements.txt",
-            "pyproject.toml",
-            "tsconfig.json"
+        # Sort priority configs first; decorate-sort-undecorate computes
+        # each basename once instead of O(n log n) times
+        keyed = [
+            (os.path.basename(x) not in _PRIORITY_CONFIGS, os.path.basename(x), x)
+            for x in found_configs
         ]
-        
-        # Sort by priority
-        found_configs.sort(
-            key=lambda x: (
-                Path(x).name not in priority_configs,
-                Path(x).name
-            )
-        )
+        keyed.sort()
+        found_configs = [t[2] for t in keyed]
         
         # Read config files
         for config_path in found_configs[:3]:  # Max 3 config files
@@ -287,7 +314,7 @@ class ContextBuilder:
                 file_context = FileContext(
                     file_path=config_path,
                     start_line=1,
-                    end_line=len(content.split('\n')),
+                    end_line=content.count('\n') + (0 if content.endswith('\n') else 1),
                     content=content,
                     is_primary=False
                 )
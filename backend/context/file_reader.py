@@ -3,10 +3,36 @@ File Reader with Encoding Detection
 Safely reads files with automatic encoding detection
 """
 
+import mmap
+import os
+import stat
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Dict, List, Optional, Tuple
 import chardet
 
+# Files above this size are memory-mapped for window reads; below it a
+# plain buffered read is cheaper than the mmap setup
+_MMAP_THRESHOLD = 64 * 1024
+
+# Per-process cache of (mtime, size, mmap, newline offsets) so repeated
+# windows on the same file reuse one mapping and one newline scan
+_mmap_cache: "OrderedDict[str, Tuple[float, int, mmap.mmap, List[int]]]" = OrderedDict()
+_MMAP_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=256)
+def _read_bytes_cached(file_path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Raw file bytes keyed on the stat signature
+
+    Repeated runs against the same project re-read the same handful of
+    source and config files; the mtime key invalidates naturally when a
+    file changes.
+    """
+    return Path(file_path).read_bytes()
+
 
 class FileReader:
     """
@@ -27,9 +53,25 @@ class FileReader:
         """
         try:
             with open(file_path, 'rb') as f:
-                raw_data = f.read(10000)  # Read first 10KB for detection
-                result = chardet.detect(raw_data)
-                return result['encoding'] or 'utf-8'
+                raw_data = f.read(65536)
+
+            # BOM check is a constant-time prefix comparison
+            if raw_data.startswith(b'\xef\xbb\xbf'):
+                return 'utf-8-sig'
+            if raw_data.startswith(b'\xff\xfe') or raw_data.startswith(b'\xfe\xff'):
+                return 'utf-16'
+
+            # Fast path: nearly all source files are plain UTF-8, and a
+            # C-level decode attempt is far cheaper than chardet's
+            # pure-Python statistical scan
+            try:
+                raw_data.decode('utf-8')
+                return 'utf-8'
+            except UnicodeDecodeError:
+                pass
+
+            result = chardet.detect(raw_data)
+            return result['encoding'] or 'utf-8'
         except Exception:
             return 'utf-8'  # Default fallback
     
@@ -56,42 +98,98 @@ class FileReader:
             FileNotFoundError: If file doesn't exist
             Exception: If file can't be read
         """
-        path = Path(file_path)
-        
-        if not path.exists():
+        try:
+            st = os.stat(file_path)
+        except OSError:
             raise FileNotFoundError(f"File not found: {file_path}")
-        
-        if not path.is_file():
+
+        if not stat.S_ISREG(st.st_mode):
             raise ValueError(f"Not a file: {file_path}")
-        
-        # Auto-detect encoding if not provided
+
+        # Handle line range
+        if start_line < 1:
+            start_line = 1
+
+        # One read, then decode in memory - the old flow could open the
+        # file three times (encoding probe, text read, latin-1 retry).
+        # The byte cache serves repeat reads of unchanged files without
+        # touching the filesystem again.
+        data = _read_bytes_cached(file_path, st.st_mtime_ns, st.st_size)
+
         if encoding is None:
-            encoding = FileReader.detect_encoding(file_path)
-        
+            try:
+                text = data.decode('utf-8')
+            except UnicodeDecodeError:
+                # Rare non-UTF-8 file: detect on the bytes we already
+                # have instead of re-reading
+                detected = chardet.detect(data[:65536])['encoding'] or 'latin-1'
+                try:
+                    text = data.decode(detected, errors='replace')
+                except LookupError:
+                    text = data.decode('latin-1')
+        else:
+            try:
+                text = data.decode(encoding, errors='replace')
+            except LookupError:
+                # Unknown codec name - latin-1 accepts all byte values
+                text = data.decode('latin-1')
+
+        lines = text.splitlines(keepends=True)
+        return ''.join(lines[start_line - 1:end_line])
+    
+    @staticmethod
+    def _mmap_window(file_path: str, start_line: int, end_line: int) -> Optional[str]:
+        """
+        Read a line window from a memory-mapped file
+
+        The newline offsets are scanned once per file (mmap.find runs at
+        C speed) and cached, so repeated windows - several stack frames
+        in the same file - cost only a slice and a decode.
+
+        Returns:
+            Window content, or None if the mmap path doesn't apply
+        """
         try:
-            with open(path, 'r', encoding=encoding, errors='replace') as f:
-                lines = f.readlines()
-            
-            # Handle line range
-            if start_line < 1:
-                start_line = 1
-            
-            if end_line is None:
-                end_line = len(lines)
+            st = os.stat(file_path)
+            if st.st_size < _MMAP_THRESHOLD:
+                return None
+
+            entry = _mmap_cache.get(file_path)
+            if entry is not None and (entry[0], entry[1]) == (st.st_mtime, st.st_size):
+                _, _, mm, offsets = entry
+                _mmap_cache.move_to_end(file_path)
             else:
-                end_line = min(end_line, len(lines))
-            
-            # Extract requested lines (convert to 0-indexed)
-            selected_lines = lines[start_line-1:end_line]
-            return ''.join(selected_lines)
-            
-        except UnicodeDecodeError:
-            # Fallback to latin-1 which accepts all byte values
-            with open(path, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
-                selected_lines = lines[start_line-1:end_line if end_line else len(lines)]
-                return ''.join(selected_lines)
-    
+                if entry is not None:
+                    entry[2].close()
+                    del _mmap_cache[file_path]
+
+                with open(file_path, 'rb') as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+                offsets = []
+                pos = mm.find(b'\n')
+                while pos != -1:
+                    offsets.append(pos)
+                    pos = mm.find(b'\n', pos + 1)
+
+                _mmap_cache[file_path] = (st.st_mtime, st.st_size, mm, offsets)
+                if len(_mmap_cache) > _MMAP_CACHE_SIZE:
+                    _, _, old_mm, _ = _mmap_cache.popitem(last=False)[1]
+                    old_mm.close()
+
+            # Line N spans (offsets[N-2]+1 .. offsets[N-1]) in bytes
+            start_byte = 0 if start_line <= 1 else (
+                offsets[start_line - 2] + 1 if start_line - 2 < len(offsets) else st.st_size
+            )
+            end_byte = (
+                offsets[end_line - 1] + 1 if end_line - 1 < len(offsets) else st.st_size
+            )
+
+            return mm[start_byte:end_byte].decode('utf-8', errors='replace')
+
+        except Exception:
+            return None
+
     @staticmethod
     def get_lines_around(
         file_path: str,
@@ -113,8 +211,12 @@ class FileReader:
         """
         start_line = max(1, target_line - context_lines)
         end_line = target_line + context_lines
-        
-        content = FileReader.read_file(file_path, start_line, end_line, encoding)
+
+        # Large files go through the cached mmap; small ones through a
+        # plain buffered read
+        content = FileReader._mmap_window(file_path, start_line, end_line)
+        if content is None:
+            content = FileReader.read_file(file_path, start_line, end_line, encoding)
         
         # Count actual lines in content
         actual_lines = content.count('\n')
@@ -126,15 +228,22 @@ class FileReader:
             "end_line": actual_end,
             "target_line": target_line,
             "content": content,
-            "total_lines": len(content.split('\n'))
+            "total_lines": content.count('\n') + (0 if content.endswith('\n') else 1)
         }
     
     @staticmethod
     def file_exists(file_path: str) -> bool:
-        """Check if file exists"""
-        return Path(file_path).exists() and Path(file_path).is_file()
-    
+        """Check if file exists and is a regular file (one stat call)"""
+        try:
+            return stat.S_ISREG(os.stat(file_path).st_mode)
+        except OSError:
+            return False
+
     @staticmethod
     def get_file_size(file_path: str) -> int:
-        """Get file size in bytes"""
-        return Path(file_path).stat().st_size if FileReader.file_exists(file_path) else 0
+        """Get file size in bytes (0 if missing or not a regular file)"""
+        try:
+            st = os.stat(file_path)
+            return st.st_size if stat.S_ISREG(st.st_mode) else 0
+        except OSError:
+            return 0
@@ -3,10 +3,87 @@ Git Analyzer
 Analyzes recent git changes for context
 """
 
+import os
 import subprocess
-from typing import Optional, List
+import time
+from functools import lru_cache
+from typing import Dict, Optional, List, Tuple
 from pathlib import Path
 
+# pygit2 talks to libgit2 in-process - no fork, no output parsing.
+# Optional: every caller falls back to the subprocess path without it.
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Repository handles are cheap to reuse and expensive to discover
+_repo_cache: Dict[str, "pygit2.Repository"] = {}
+
+
+def _get_repo(directory: str):
+    """Open (and cache) the pygit2 repository containing directory"""
+    if pygit2 is None:
+        return None
+
+    key = str(directory)
+    repo = _repo_cache.get(key)
+    if repo is not None:
+        return repo
+
+    try:
+        git_dir = pygit2.discover_repository(key)
+        if git_dir is None:
+            return None
+        repo = pygit2.Repository(git_dir)
+        _repo_cache[key] = repo
+        return repo
+    except Exception:
+        return None
+
+
+def _relative_date(timestamp: float) -> str:
+    """Format an epoch timestamp like git's %ar ('3 minutes ago')"""
+    delta = time.time() - timestamp
+    for unit, seconds in (
+        ("year", 31536000),
+        ("month", 2592000),
+        ("day", 86400),
+        ("hour", 3600),
+        ("minute", 60),
+        ("second", 1),
+    ):
+        count = int(delta // seconds)
+        if count >= 1:
+            return f"{count} {unit}{'s' if count > 1 else ''} ago"
+    return "just now"
+
+
+@lru_cache(maxsize=256)
+def _is_git_repo_cached(directory: str) -> bool:
+    """Cached repo check - ancestor walk first, fork only as a last resort"""
+    try:
+        resolved = Path(directory).resolve()
+        for candidate in (resolved, *resolved.parents):
+            # .git is a directory in normal checkouts, a file in worktrees
+            if (candidate / ".git").exists():
+                return True
+    except Exception:
+        pass
+
+    # No .git ancestor found; ask git itself in case GIT_DIR or similar
+    # still makes this a repository
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--git-dir"],
+            cwd=directory,
+            capture_output=True,
+            timeout=2
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
 
 class GitAnalyzer:
     """
@@ -24,16 +101,9 @@ class GitAnalyzer:
         Returns:
             True if git repo, False otherwise
         """
-        try:
-            result = subprocess.run(
-                ["git", "rev-parse", "--git-dir"],
-                cwd=directory,
-                capture_output=True,
-                timeout=2
-            )
-            return result.returncode == 0
-        except:
-            return False
+        if pygit2 is not None:
+            return _get_repo(str(directory)) is not None
+        return _is_git_repo_cached(str(directory))
     
     @staticmethod
     def get_recent_changes(
@@ -52,9 +122,32 @@ class GitAnalyzer:
         Returns:
             Git diff string or None
         """
-        if not GitAnalyzer.is_git_repo(Path(file_path).parent):
+        parent = str(Path(file_path).parent)
+        if not GitAnalyzer.is_git_repo(parent):
             return None
-        
+
+        # In-process diff when libgit2 is available
+        repo = _get_repo(parent)
+        if repo is not None:
+            try:
+                tree = repo.revparse_single(f"HEAD~{commits_back}").peel(pygit2.Tree)
+                rel = os.path.relpath(
+                    str(Path(file_path).resolve()), repo.workdir
+                ).replace('\\', '/')
+
+                chunks = [
+                    patch.text
+                    for patch in repo.diff(tree)
+                    if rel in (patch.delta.new_file.path, patch.delta.old_file.path)
+                ]
+
+                if chunks:
+                    diff_lines = '\n'.join(chunks).split('\n')[:max_lines]
+                    return '\n'.join(diff_lines)
+                return None
+            except Exception:
+                pass  # Fall back to the subprocess path
+
         try:
             # Get diff from HEAD~N to current
             result = subprocess.run(
@@ -77,6 +170,136 @@ class GitAnalyzer:
         
         return None
     
+    @staticmethod
+    def batch_log_and_diff(
+        file_paths: List[str],
+        commits_back: int = 1,
+        limit: int = 3,
+        max_diff_lines: int = 30
+    ) -> Dict[str, Tuple[Optional[str], List[dict]]]:
+        """
+        Get diffs and recent commits for several files in two git calls
+
+        Fetching per file costs a fork each; batching all paths into one
+        `git diff` and one `git log --name-only` keeps process spawns
+        constant no matter how many stack frames an error has.
+
+        Args:
+            file_paths: Paths to look up
+            commits_back: How many commits back to diff against
+            limit: Maximum commits to keep per file
+            max_diff_lines: Maximum lines of diff per file
+
+        Returns:
+            Dictionary of file_path -> (diff or None, commit list)
+        """
+        results: Dict[str, Tuple[Optional[str], List[dict]]] = {
+            path: (None, []) for path in file_paths
+        }
+
+        if not file_paths:
+            return results
+
+        cwd = str(Path(file_paths[0]).parent)
+        if not GitAnalyzer.is_git_repo(cwd):
+            return results
+
+        # Absolute pathspecs work regardless of which directory git
+        # runs from (relative ones resolve against cwd, not the repo)
+        abs_paths = [str(Path(p).resolve()) for p in file_paths]
+
+        diffs: Dict[str, str] = {}
+        commits: Dict[str, List[dict]] = {path: [] for path in file_paths}
+
+        def match_path(repo_rel: str) -> Optional[str]:
+            # git prints repo-relative paths; map back to what we were given
+            norm = repo_rel.replace('\\', '/')
+            for path in file_paths:
+                p = str(path).replace('\\', '/')
+                if p.endswith(norm) or norm.endswith(p):
+                    return path
+            return None
+
+        # One diff covering every file, split on "diff --git" headers
+        try:
+            result = subprocess.run(
+                ["git", "diff", f"HEAD~{commits_back}", "--", *abs_paths],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                cwd=cwd
+            )
+
+            if result.returncode == 0 and result.stdout:
+                current = None
+                for line in result.stdout.split('\n'):
+                    if line.startswith("diff --git "):
+                        current = match_path(line.split(" b/")[-1])
+                        if current is not None:
+                            diffs[current] = []
+                    if current is not None:
+                        section = diffs.get(current)
+                        if section is not None and len(section) < max_diff_lines:
+                            section.append(line)
+        except Exception:
+            pass
+
+        # One log covering every file; --name-only maps commits to files
+        try:
+            result = subprocess.run(
+                [
+                    "git", "log", f"-{limit * len(file_paths)}",
+                    "--format=%H|%an|%ar|%s", "--name-only", "--", *abs_paths
+                ],
+                capture_output=True,
+                text=True,
+                timeout=5,
+                cwd=cwd
+            )
+
+            if result.returncode == 0:
+                current_commit = None
+                walked = 0
+                for line in result.stdout.split('\n'):
+                    if not line:
+                        continue
+                    parts = line.split('|', 3)
+                    if len(parts) == 4 and len(parts[0]) == 40:
+                        current_commit = {
+                            "hash": parts[0][:8],
+                            "author": parts[1],
+                            "date": parts[2],
+                            "message": parts[3]
+                        }
+                        walked += 1
+                    elif current_commit is not None:
+                        path = match_path(line)
+                        if path is not None and len(commits[path]) < limit:
+                            commits[path].append(current_commit)
+
+                # The shared window caps total history walked, so one
+                # file's churn can starve a co-batched file whose last
+                # commits are older. Only when git filled the window
+                # completely can a short list mean starvation rather
+                # than exhausted history - top those up per file
+                if walked >= limit * len(file_paths):
+                    for path, abs_path in zip(file_paths, abs_paths):
+                        if len(commits[path]) < limit:
+                            commits[path] = GitAnalyzer.get_recent_commits(
+                                abs_path, limit=limit
+                            )
+        except Exception:
+            pass
+
+        for path in file_paths:
+            diff_lines = diffs.get(path)
+            results[path] = (
+                '\n'.join(diff_lines) if diff_lines else None,
+                commits[path]
+            )
+
+        return results
+
     @staticmethod
     def get_file_blame(
         file_path: str,
@@ -135,11 +358,53 @@ class GitAnalyzer:
         Returns:
             List of commit info dictionaries
         """
-        if not GitAnalyzer.is_git_repo(Path(file_path).parent):
+        parent = str(Path(file_path).parent)
+        if not GitAnalyzer.is_git_repo(parent):
             return []
-        
+
+        # In-process history walk when libgit2 is available
+        repo = _get_repo(parent)
+        if repo is not None:
+            try:
+                rel = os.path.relpath(
+                    str(Path(file_path).resolve()), repo.workdir
+                ).replace('\\', '/')
+
+                def blob_id(commit):
+                    try:
+                        return commit.tree[rel].id
+                    except Exception:
+                        return None
+
+                commits = []
+                walker = repo.walk(
+                    repo.head.target,
+                    pygit2.GIT_SORT_TOPOLOGICAL | pygit2.GIT_SORT_TIME
+                )
+                for commit in walker:
+                    current = blob_id(commit)
+                    parents = commit.parents
+                    if parents:
+                        changed = all(blob_id(p) != current for p in parents)
+                    else:
+                        changed = current is not None
+
+                    if changed:
+                        commits.append({
+                            "hash": str(commit.id)[:8],
+                            "author": commit.author.name,
+                            "date": _relative_date(commit.commit_time),
+                            "message": commit.message.split('\n', 1)[0]
+                        })
+                        if len(commits) >= limit:
+                            break
+
+                return commits
+            except Exception:
+                pass  # Fall back to the subprocess path
+
         commits = []
-        
+
         try:
             # Format: hash|author|date|message
             result = subprocess.run(
@@ -147,7 +412,7 @@ class GitAnalyzer:
                 capture_output=True,
                 text=True,
                 timeout=5,
-                cwd=str(Path(file_path).parent)
+                cwd=parent
             )
             
             if result.returncode == 0:
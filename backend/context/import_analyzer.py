@@ -4,9 +4,244 @@ Analyzes import statements and resolves dependencies
 """
 
 import ast
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Optional
+from typing import List, Set, Optional, Tuple
+
+
+# Compiled once - the per-call re.findall(str, ...) form pays a cache
+# lookup and hash per pattern per file. The JS forms (ES6 import,
+# require(), dynamic import()) are fused into one alternation so the
+# content buffer is scanned once instead of three times.
+_JS_IMPORT_RE = re.compile(
+    r'(?:import\s+(?:[\w\s{},*]+\s+from\s+)?|require\(|import\()[\'"]([^\'"]+)[\'"]'
+)
+_PY_IMPORT_RE = re.compile(r'^\s*(?:from\s+([\w.]+)\s+)?import\s+([\w\s,]+)', re.MULTILINE)
+
+# Vendored/generated trees that would balloon the chain by orders of
+# magnitude without adding context worth showing the LLM
+_SKIP_DIRS = frozenset({
+    'node_modules',
+    '.venv',
+    'venv',
+    'site-packages',
+    '__pycache__',
+    'dist',
+    'build',
+})
+
+
+@lru_cache(maxsize=4096)
+def _python_imports_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """
+    Parse Python imports once per (path, mtime, size)
+
+    AST parsing dominates chain building; keying the cache on the stat
+    signature means edits invalidate naturally while repeated chain
+    builds in one session parse each file exactly once.
+    """
+    # PEP 526 locals let Cython's pure-python mode type these
+    imports: list = []
+
+    try:
+        with open(file_path, 'rb') as f:
+            data: bytes = f.read()
+
+        # Bytes substring search runs at C speed - a file with no
+        # 'import' token anywhere can't import anything, so it never
+        # pays for ast.parse
+        if b'import' not in data:
+            return ()
+
+        # Imports conventionally live near the top, so parsing past the
+        # paragraph that holds the last 'import' token is wasted AST
+        # work. Cut at the first blank line after it; if the cut lands
+        # mid-construct the prefix won't parse and the full file does.
+        # (b'\n' can't occur inside a multi-byte UTF-8 sequence, so the
+        # truncation is always decodable.)
+        cut = data.find(b'\n\n', data.rfind(b'import'))
+        tree = None
+        if cut != -1:
+            try:
+                tree = ast.parse(data[:cut].decode('utf-8'), filename=file_path)
+            except SyntaxError:
+                tree = None
+        if tree is None:
+            try:
+                tree = ast.parse(data.decode('utf-8'), filename=file_path)
+            except SyntaxError:
+                # If syntax error, try to extract imports with regex
+                return tuple(ImportAnalyzer._extract_python_imports_regex(file_path))
+
+        # Imports live at the top level (possibly wrapped in if/try for
+        # guarded imports) - no need for ast.walk to visit every
+        # expression node in the file
+        stack = list(tree.body)
+        while stack:
+            node = stack.pop()
+
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.append(alias.name)
+
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    imports.append(node.module)
+                # Also capture relative imports
+                if node.level > 0:  # Relative import
+                    imports.append('.' * node.level + (node.module or ''))
+
+            elif isinstance(node, ast.If):
+                stack.extend(node.body)
+                stack.extend(node.orelse)
+
+            elif isinstance(node, ast.Try):
+                stack.extend(node.body)
+                stack.extend(node.orelse)
+                stack.extend(node.finalbody)
+                for handler in node.handlers:
+                    stack.extend(handler.body)
+
+    except Exception:
+        # Fallback to regex if AST parsing fails
+        return tuple(ImportAnalyzer._extract_python_imports_regex(file_path))
+
+    return tuple(imports)
+
+
+@lru_cache(maxsize=1024)
+def _dir_entries_cached(dir_str: str, mtime_ns: int) -> frozenset:
+    try:
+        with os.scandir(dir_str) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+
+def _dir_entries(dir_str: str) -> frozenset:
+    """
+    List a directory once per mtime - membership checks replace stat
+    probes, and creating/deleting a file bumps the directory's mtime so
+    the listing refreshes (same stat-signature scheme as the import
+    caches above; a plain path-keyed cache went stale in watch mode)
+    """
+    try:
+        mtime_ns = os.stat(dir_str).st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _dir_entries_cached(dir_str, mtime_ns)
+
+
+@lru_cache(maxsize=8192)
+def _resolve_python_cached(dir_str: str, import_name: str) -> Optional[str]:
+    """
+    Resolve a Python import relative to a directory
+
+    Keyed on the directory, not the importing file, so sibling files
+    that share imports collapse to one resolution. Paths stay plain
+    strings throughout - os.path calls are C-level and skip PurePath's
+    allocation and parts parsing on every candidate.
+    """
+    # Handle relative imports
+    if import_name.startswith('.'):
+        # Count leading dots
+        level = len(import_name) - len(import_name.lstrip('.'))
+        module = import_name.lstrip('.')
+
+        # Go up directories
+        target_dir = dir_str
+        for _ in range(level - 1):
+            target_dir = os.path.dirname(target_dir) or '.'
+
+        # Try to resolve module
+        if module:
+            module_path = os.path.join(target_dir, module.replace('.', '/'))
+        else:
+            module_path = target_dir
+    else:
+        # Absolute import - try from current directory first
+        module_path = os.path.join(dir_str, import_name.replace('.', '/'))
+
+    # One split + one listing lookup covers every candidate - the
+    # per-candidate loop paid a split and a cache probe each time
+    parent, leaf = os.path.split(module_path)
+    entries = _dir_entries(parent or '.')
+
+    if leaf + '.py' in entries:
+        return module_path + '.py'
+    # No bare-path fallback: Python imports never carry an extension,
+    # and a directory without __init__.py isn't a readable source file
+    # for the downstream context gatherers anyway
+    if leaf in entries and '__init__.py' in _dir_entries(module_path):
+        return module_path + '/__init__.py'
+
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _resolve_js_cached(dir_str: str, import_path: str) -> Optional[str]:
+    """Resolve a JS/TS relative import against a directory"""
+    target_path = os.path.normpath(os.path.join(dir_str, import_path))
+
+    parent, leaf = os.path.split(target_path)
+    entries = _dir_entries(parent or '.')
+
+    # Import already names its extension ('./helper.js') - one lookup
+    if leaf.endswith(('.js', '.ts', '.jsx', '.tsx')):
+        return target_path if leaf in entries else None
+
+    # Direct-file candidates share the parent listing
+    for ext in ('.js', '.ts', '.jsx', '.tsx'):
+        if leaf + ext in entries:
+            return target_path + ext
+
+    # Directory imports resolve against the target's own listing
+    if leaf in entries:
+        dir_entries = _dir_entries(target_path)
+        for index in ('index.js', 'index.ts'):
+            if index in dir_entries:
+                return target_path + '/' + index
+        return target_path
+
+    return None
+
+
+def clear_resolution_caches():
+    """
+    Drop the memoized import resolutions and directory listings
+
+    The resolver caches memoize their final answer (including "not
+    found") with no freshness key, which is fine for one-shot runs but
+    wrong for long-lived processes: watch mode calls this before each
+    analysis so modules created since the last run become resolvable.
+    """
+    _resolve_python_cached.cache_clear()
+    _resolve_js_cached.cache_clear()
+    _dir_entries_cached.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def _js_imports_cached(file_path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Extract JS/TS imports once per (path, mtime, size)"""
+    imports: list = []
+
+    try:
+        with open(file_path, 'rb') as f:
+            data: bytes = f.read()
+
+        # Same prefilter as the Python side: no token, no regex pass
+        if b'import' not in data and b'require' not in data:
+            return ()
+
+        # ES6 imports, require(), and dynamic import() in one pass
+        imports.extend(_JS_IMPORT_RE.findall(data.decode('utf-8', errors='replace')))
+
+    except Exception:
+        pass
+
+    return tuple(imports)
 
 
 class ImportAnalyzer:
@@ -26,33 +261,12 @@ class ImportAnalyzer:
         Returns:
             List of imported module names
         """
-        imports = []
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                try:
-                    tree = ast.parse(f.read(), filename=file_path)
-                except SyntaxError:
-                    # If syntax error, try to extract imports with regex
-                    return ImportAnalyzer._extract_python_imports_regex(file_path)
-            
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        imports.append(alias.name)
-                
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.append(node.module)
-                    # Also capture relative imports
-                    if node.level > 0:  # Relative import
-                        imports.append('.' * node.level + (node.module or ''))
-        
-        except Exception as e:
-            # Fallback to regex if AST parsing fails
-            return ImportAnalyzer._extract_python_imports_regex(file_path)
-        
-        return imports
+            st = os.stat(file_path)
+        except OSError:
+            return []
+
+        return list(_python_imports_cached(file_path, st.st_mtime_ns, st.st_size))
     
     @staticmethod
     def _extract_python_imports_regex(file_path: str) -> List[str]:
@@ -64,9 +278,7 @@ class ImportAnalyzer:
                 content = f.read()
             
             # Pattern: import module or from module import ...
-            import_pattern = r'^\s*(?:from\s+([\w.]+)\s+)?import\s+([\w\s,]+)'
-            
-            for match in re.finditer(import_pattern, content, re.MULTILINE):
+            for match in _PY_IMPORT_RE.finditer(content):
                 if match.group(1):  # from X import Y
                     imports.append(match.group(1))
                 else:  # import X
@@ -89,29 +301,12 @@ class ImportAnalyzer:
         Returns:
             List of imported module paths
         """
-        imports = []
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Pattern 1: import ... from 'module'
-            es6_pattern = r'import\s+(?:[\w\s{},*]+\s+from\s+)?[\'"]([^\'"]+)[\'"]'
-            
-            # Pattern 2: require('module')
-            require_pattern = r'require\([\'"]([^\'"]+)[\'"]\)'
-            
-            # Pattern 3: import('module') - dynamic import
-            dynamic_pattern = r'import\([\'"]([^\'"]+)[\'"]\)'
-            
-            for pattern in [es6_pattern, require_pattern, dynamic_pattern]:
-                matches = re.findall(pattern, content)
-                imports.extend(matches)
-        
-        except Exception:
-            pass
-        
-        return imports
+            st = os.stat(file_path)
+        except OSError:
+            return []
+
+        return list(_js_imports_cached(file_path, st.st_mtime_ns, st.st_size))
     
     @staticmethod
     def resolve_python_import(current_file: str, import_name: str) -> Optional[str]:
@@ -125,35 +320,7 @@ class ImportAnalyzer:
         Returns:
             Resolved file path or None
         """
-        current_dir = Path(current_file).parent
-        
-        # Handle relative imports
-        if import_name.startswith('.'):
-            # Count leading dots
-            level = len(import_name) - len(import_name.lstrip('.'))
-            module = import_name.lstrip('.')
-            
-            # Go up directories
-            target_dir = current_dir
-            for _ in range(level - 1):
-                target_dir = target_dir.parent
-            
-            # Try to resolve module
-            if module:
-                module_path = target_dir / module.replace('.', '/')
-            else:
-                module_path = target_dir
-        else:
-            # Absolute import - try from current directory first
-            module_path = current_dir / import_name.replace('.', '/')
-        
-        # Try different extensions
-        for ext in ['.py', '/__init__.py', '']:
-            test_path = Path(str(module_path) + ext)
-            if test_path.exists():
-                return str(test_path)
-        
-        return None
+        return _resolve_python_cached(os.path.dirname(current_file) or '.', import_name)
     
     @staticmethod
     def resolve_js_import(current_file: str, import_path: str) -> Optional[str]:
@@ -170,63 +337,93 @@ class ImportAnalyzer:
         # Skip node_modules and absolute imports
         if not import_path.startswith('.'):
             return None
-        
-        current_dir = Path(current_file).parent
-        target_path = current_dir / import_path
-        
-        # Try different extensions
-        extensions = ['.js', '.ts', '.jsx', '.tsx', '/index.js', '/index.ts', '']
-        
-        for ext in extensions:
-            test_path = Path(str(target_path) + ext)
-            if test_path.exists():
-                return str(test_path)
-        
-        return None
+
+        return _resolve_js_cached(os.path.dirname(current_file) or '.', import_path)
     
     @staticmethod
     def build_import_chain(
         file_path: str,
         max_depth: int = 2,
-        visited: Optional[Set[str]] = None
+        visited: Optional[Set[str]] = None,
+        limit: Optional[int] = None,
+        skip_dirs: frozenset = _SKIP_DIRS
     ) -> Set[str]:
         """
         Build import dependency chain recursively
-        
+
         Args:
             file_path: Starting file path
             max_depth: Maximum recursion depth
             visited: Set of already visited files (for cycle detection)
-            
+            limit: Stop once this many files are collected (None = no cap)
+            skip_dirs: Directory names pruned from the chain (vendored
+                trees like node_modules are never opened or parsed)
+
         Returns:
             Set of all files in import chain
         """
         if visited is None:
             visited = set()
-        
-        # Normalize path
-        file_path = str(Path(file_path).resolve())
-        
-        if file_path in visited or max_depth <= 0:
-            return visited
-        
-        visited.add(file_path)
-        
-        # Determine file type
-        if file_path.endswith('.py'):
-            imports = ImportAnalyzer.get_python_imports(file_path)
-            
-            for imp in imports:
-                resolved = ImportAnalyzer.resolve_python_import(file_path, imp)
-                if resolved and resolved not in visited:
-                    ImportAnalyzer.build_import_chain(resolved, max_depth - 1, visited)
-        
-        elif file_path.endswith(('.js', '.ts', '.jsx', '.tsx')):
-            imports = ImportAnalyzer.get_js_imports(file_path)
-            
-            for imp in imports:
-                resolved = ImportAnalyzer.resolve_js_import(file_path, imp)
-                if resolved and resolved not in visited:
-                    ImportAnalyzer.build_import_chain(resolved, max_depth - 1, visited)
-        
+
+        # Iterative BFS in level waves: no call frame per file, no
+        # recursion-limit concerns, and each wave's file reads + parses
+        # run concurrently (I/O releases the GIL). visited is only
+        # touched between waves, so no locking is needed.
+        wave = [str(Path(file_path).resolve())]
+        depth = max_depth
+
+        while wave and depth > 0:
+            batch = []
+            for path in wave:
+                if path in visited:
+                    continue
+                # Prune vendored trees before any open/parse happens
+                if skip_dirs and not skip_dirs.isdisjoint(path.split(os.sep)):
+                    continue
+                # Callers that only display a few files shouldn't pay
+                # for resolving the full fanout
+                if limit is not None and len(visited) >= limit:
+                    return visited
+                visited.add(path)
+                if Path(path).suffix in _IMPORT_DISPATCH:
+                    batch.append(path)
+
+            if not batch:
+                break
+
+            def extract(path):
+                return _IMPORT_DISPATCH[Path(path).suffix][0](path)
+
+            if len(batch) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=min(8, len(batch))) as pool:
+                    import_lists = list(pool.map(extract, batch))
+            else:
+                import_lists = [extract(batch[0])]
+
+            # Resolution stays serial - it's all cached lookups
+            next_wave = []
+            for path, imports in zip(batch, import_lists):
+                resolve = _IMPORT_DISPATCH[Path(path).suffix][1]
+                for imp in imports:
+                    resolved = resolve(path, imp)
+                    if resolved:
+                        resolved = str(Path(resolved).resolve())
+                        if resolved not in visited:
+                            next_wave.append(resolved)
+
+            wave = next_wave
+            depth -= 1
+
         return visited
+
+
+# Suffix -> (extract imports, resolve one import) dispatch for the BFS
+_IMPORT_DISPATCH = {
+    '.py': (ImportAnalyzer.get_python_imports, ImportAnalyzer.resolve_python_import),
+    '.js': (ImportAnalyzer.get_js_imports, ImportAnalyzer.resolve_js_import),
+    '.ts': (ImportAnalyzer.get_js_imports, ImportAnalyzer.resolve_js_import),
+    '.jsx': (ImportAnalyzer.get_js_imports, ImportAnalyzer.resolve_js_import),
+    '.tsx': (ImportAnalyzer.get_js_imports, ImportAnalyzer.resolve_js_import),
+}
@@ -3,6 +3,23 @@ Token Budget Manager
 Ensures context doesn't exceed LLM token limits
 """
 
+from functools import lru_cache
+
+# tiktoken gives real BPE counts instead of the chars//3 rule of thumb
+# (which mis-budgets by 20-40% on code); optional like other speedups
+try:
+    import tiktoken
+
+    _ENC = tiktoken.get_encoding("cl100k_base")
+except Exception:
+    _ENC = None
+
+
+@lru_cache(maxsize=2048)
+def _bpe_count(text: str) -> int:
+    """Exact token count, cached - agent runs re-add identical snippets"""
+    return len(_ENC.encode(text))
+
 
 class TokenManager:
     """
@@ -18,7 +35,11 @@ class TokenManager:
         """
         self.max_tokens = max_tokens
         self.current_tokens = 0
+        # (label, tokens, length) tuples - roughly 3x smaller than one
+        # dict per entry; get_summary rebuilds dicts only when asked
         self.items = []
+        # Percentage is recomputed only when current_tokens changes
+        self._usage_pct = 0.0
     
     def estimate_tokens(self, text: str) -> int:
         """
@@ -34,9 +55,34 @@ class TokenManager:
         Returns:
             Estimated token count
         """
+        if _ENC is not None:
+            return _bpe_count(text)
         # Use conservative estimate for code
         return len(text) // 3
-    
+
+    def _budget_estimate(self, text: str) -> int:
+        """
+        Token count for budget decisions
+
+        The chars//3 heuristic is decisive while there's plenty of
+        headroom; the exact (and pricier) BPE count only runs near the
+        threshold, where 20-40% heuristic error would matter.
+        """
+        rough = len(text) // 3
+        if _ENC is None:
+            return rough
+        if self.current_tokens + (rough * 3) // 2 <= self.max_tokens:
+            return rough
+        return _bpe_count(text)
+
+    def _clearly_over_budget(self, text: str) -> bool:
+        """
+        Cheap rejection bound: ~4 chars per token is optimistic for
+        code, so if even len//4 doesn't fit, no tokenizer pass can
+        change the answer - skip estimating a chunk that can't fit
+        """
+        return self.current_tokens + len(text) // 4 > self.max_tokens
+
     def can_add(self, text: str, priority: int = 0) -> bool:
         """
         Check if text can be added within budget
@@ -48,7 +94,9 @@ class TokenManager:
         Returns:
             True if can be added, False otherwise
         """
-        estimated = self.estimate_tokens(text)
+        if self._clearly_over_budget(text):
+            return False
+        estimated = self._budget_estimate(text)
         return (self.current_tokens + estimated) <= self.max_tokens
     
     def add(self, text: str, label: str = "unknown") -> bool:
@@ -62,15 +110,14 @@ class TokenManager:
         Returns:
             True if added, False if exceeds budget
         """
-        estimated = self.estimate_tokens(text)
+        if self._clearly_over_budget(text):
+            return False
+        estimated = self._budget_estimate(text)
         
         if (self.current_tokens + estimated) <= self.max_tokens:
             self.current_tokens += estimated
-            self.items.append({
-                "label": label,
-                "tokens": estimated,
-                "length": len(text)
-            })
+            self.items.append((label, estimated, len(text)))
+            self._usage_pct = self.current_tokens * 100.0 / self.max_tokens
             return True
         
         return False
@@ -80,13 +127,14 @@ class TokenManager:
         return max(0, self.max_tokens - self.current_tokens)
     
     def get_usage_percentage(self) -> float:
-        """Get budget usage as percentage"""
-        return (self.current_tokens / self.max_tokens) * 100
+        """Get budget usage as percentage (cached, updated on add/reset)"""
+        return self._usage_pct
     
     def reset(self):
         """Reset token counter"""
         self.current_tokens = 0
         self.items = []
+        self._usage_pct = 0.0
     
     def get_summary(self) -> dict:
         """Get usage summary"""
@@ -96,5 +144,8 @@ class TokenManager:
             "remaining_tokens": self.get_remaining(),
             "usage_percentage": self.get_usage_percentage(),
             "items_count": len(self.items),
-            "items": self.items
+            "items": [
+                {"label": label, "tokens": tokens, "length": length}
+                for label, tokens, length in self.items
+            ]
         }
@@ -3,6 +3,8 @@ Graph Builder
 Constructs the LangGraph workflow
 """
 
+from functools import cache
+
 from langgraph.graph import StateGraph, END
 from .state import AgentState
 from .nodes import (
@@ -18,21 +20,29 @@ from .edges import (
     should_continue_after_gather,
     should_continue_after_analyze,
     should_continue_after_generate,
-    should_retry_after_validate
+    should_retry_after_validate,
+    should_continue_after_refine
 )
 
 
+@cache
 def build_agent_graph() -> StateGraph:
     """
     Build the complete agent workflow graph
-    
+
+    The compiled graph is stateless (all per-run data lives in
+    AgentState), so it's built once and shared by every runner instead
+    of re-running add_node/add_edge/compile per instance. It stays a
+    per-process singleton: the compiled Pregel embeds local closures,
+    so it can't be pickled to disk for reuse across processes.
+
     Graph flow:
     1. parse_error → gather_context
     2. gather_context → analyze_root_cause
     3. analyze_root_cause → generate_fixes
     4. generate_fixes → validate_fixes
     5. validate_fixes → [refine_fixes OR end]
-    6. refine_fixes → generate_fixes (retry loop)
+    6. refine_fixes → [generate_fixes OR end] (retry loop)
     
     Returns:
         Compiled StateGraph ready for execution
@@ -99,8 +109,16 @@ def build_agent_graph() -> StateGraph:
         }
     )
     
-    # Refine loops back to generate
-    workflow.add_edge("refine_fixes", "generate_fixes")
+    # Refine loops back to generate, unless it hit max retries or the
+    # refinement repeated the rejected fixes
+    workflow.add_conditional_edges(
+        "refine_fixes",
+        should_continue_after_refine,
+        {
+            "generate": "generate_fixes",
+            "end": END
+        }
+    )
     
     # Compile the graph
     return workflow.compile()
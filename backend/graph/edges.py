@@ -7,66 +7,44 @@ from typing import Literal
 from .state import AgentState
 
 
-def should_continue_after_parse(state: AgentState) -> Literal["gather", "end"]:
+def _edge(field: str, ok: str):
     """
-    Decide next step after parsing
-    
-    Returns:
-        "gather" - Continue to context gathering
-        "end" - Stop if parsing failed
-    """
-    if state["parse_success"]:
-        return "gather"
-    else:
-        return "end"
-
+    Build a success/fail edge predicate
 
-def should_continue_after_gather(state: AgentState) -> Literal["analyze", "end"]:
+    Four of the five routers share one shape - check a bool field,
+    return a target or "end" - so one closure factory replaces four
+    copies of the same bytecode.
     """
-    Decide next step after gathering context
-    
-    Returns:
-        "analyze" - Continue to root cause analysis
-        "end" - Stop if gathering failed
-    """
-    if state["context_success"]:
-        return "analyze"
-    else:
-        return "end"
+    def route(state: AgentState) -> str:
+        return ok if state[field] else "end"
 
+    route.__name__ = f"should_continue_after_{field.split('_')[0]}"
+    return route
 
-def should_continue_after_analyze(state: AgentState) -> Literal["generate", "end"]:
-    """
-    Decide next step after analysis
-    
-    Returns:
-        "generate" - Continue to fix generation
-        "end" - Stop if analysis failed
-    """
-    if state["analysis_success"]:
-        return "generate"
-    else:
-        return "end"
+
+# "gather" if parsing succeeded, "end" otherwise - and so on down the chain
+should_continue_after_parse = _edge("parse_success", "gather")
+should_continue_after_gather = _edge("context_success", "analyze")
+should_continue_after_analyze = _edge("analysis_success", "generate")
 
 
 def should_continue_after_generate(state: AgentState) -> Literal["validate", "end"]:
     """
     Decide next step after generating fixes
-    
+
     Returns:
         "validate" - Continue to validation
         "end" - Stop if generation failed
     """
     if state["generation_success"] and state["fix_suggestions"]:
         return "validate"
-    else:
-        return "end"
+    return "end"
 
 
 def should_retry_after_validate(state: AgentState) -> Literal["refine", "end"]:
     """
     Decide whether to retry after validation
-    
+
     Returns:
         "refine" - Retry with feedback
         "end" - Stop (either success or max retries reached)
@@ -74,10 +52,23 @@ def should_retry_after_validate(state: AgentState) -> Literal["refine", "end"]:
     # If validation succeeded, we're done
     if state["validation_success"]:
         return "end"
-    
+
     # If we haven't reached max retries, refine
     if state["retry_count"] < state["max_retries"]:
         return "refine"
-    
+
     # Max retries reached, stop
     return "end"
+
+
+def should_continue_after_refine(state: AgentState) -> Literal["generate", "end"]:
+    """
+    Decide whether to re-enter generation after refinement
+
+    Returns:
+        "generate" - Retry generation with the refinement feedback
+        "end" - Stop (max retries reached or refinement looped)
+    """
+    if state["status"] == "failed":
+        return "end"
+    return "generate"
@@ -3,39 +3,88 @@ Agent Workflow Nodes
 Each node is a step in the error fixing workflow
 """
 
+import ast
+import hashlib
+import logging
+import re
+import threading
 import time
 import json
+from functools import lru_cache
+from itertools import repeat
 from typing import Dict
 
+# Optional orjson fast path for the refine payload, stdlib fallback -
+# same pattern as the providers and cache manager
+try:
+    import orjson
+
+    def _dumps_compact(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps_compact(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'))
+
 from backend.parsers import ErrorClassifier
 from backend.context import ContextBuilder
 from backend.llm.provider_factory import LLMProviderFactory
 from backend.llm_prompts import AgentPrompts
 from .state import AgentState, FixSuggestion, ValidationResult
 
+# Progress messages go through the queue-backed logger configured by
+# AgentRunner (writes happen on its listener thread) rather than the
+# stdio lock, which serializes concurrent runs
+log = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_classifier() -> ErrorClassifier:
+    """One classifier per process - its parser regexes compile once"""
+    return ErrorClassifier()
+
+
+# ContextBuilder carries a mutable token budget per run, so instances
+# are reused per-thread (run_batch executes runs on separate threads)
+# rather than process-wide
+_builder_local = threading.local()
+
+
+def _get_context_builder(project_root: str) -> ContextBuilder:
+    builders = getattr(_builder_local, 'builders', None)
+    if builders is None:
+        builders = _builder_local.builders = {}
+
+    builder = builders.get(project_root)
+    if builder is None:
+        builder = builders[project_root] = ContextBuilder(
+            max_tokens=8000,
+            project_root=project_root
+        )
+    return builder
+
 
 def parse_error_node(state: AgentState) -> AgentState:
     """
     Node 1: Parse raw error log
     Classifies error type and extracts structured information
     """
-    print("🔍 [Node 1] Parsing error...")
+    log.info("🔍 [Node 1] Parsing error...")
     
     try:
-        classifier = ErrorClassifier()
+        classifier = _get_classifier()
         parsed = classifier.classify_and_parse(state["raw_error_log"])
         
         state["parsed_error"] = parsed
         state["parse_success"] = True
         state["status"] = "gathering"
         
-        print(f"   ✅ Detected: {parsed.language} - {parsed.error_type}")
+        log.info("   ✅ Detected: %s - %s", parsed.language, parsed.error_type)
         
     except Exception as e:
         state["parse_success"] = False
         state["status"] = "failed"
         state["error_message"] = f"Failed to parse error: {str(e)}"
-        print(f"   ❌ Parse failed: {e}")
+        log.error("   ❌ Parse failed: %s", e)
     
     return state
 
@@ -45,16 +94,13 @@ def gather_context_node(state: AgentState) -> AgentState:
     Node 2: Gather code context
     Collects relevant files, imports, configs, git history
     """
-    print("📚 [Node 2] Gathering context...")
+    log.info("📚 [Node 2] Gathering context...")
     
     if not state["parse_success"]:
         return state
     
     try:
-        builder = ContextBuilder(
-            max_tokens=8000,
-            project_root=state["project_root"]
-        )
+        builder = _get_context_builder(state["project_root"])
         context = builder.build(state["parsed_error"])
         
         state["code_context"] = context
@@ -62,16 +108,16 @@ def gather_context_node(state: AgentState) -> AgentState:
         state["tokens_used"] = context.total_tokens
         state["status"] = "analyzing"
         
-        print(f"   ✅ Gathered {len(context.primary_files)} primary files")
-        print(f"   ✅ Gathered {len(context.related_files)} related files")
-        print(f"   ✅ Gathered {len(context.config_files)} config files")
-        print(f"   📊 Token usage: {context.total_tokens} tokens")
+        log.info("   ✅ Gathered %d primary files", len(context.primary_files))
+        log.info("   ✅ Gathered %d related files", len(context.related_files))
+        log.info("   ✅ Gathered %d config files", len(context.config_files))
+        log.info("   📊 Token usage: %d tokens", context.total_tokens)
         
     except Exception as e:
         state["context_success"] = False
         state["status"] = "failed"
         state["error_message"] = f"Failed to gather context: {str(e)}"
-        print(f"   ❌ Context gathering failed: {e}")
+        log.error("   ❌ Context gathering failed: %s", e)
     
     return state
 
@@ -81,53 +127,70 @@ def analyze_root_cause_node(state: AgentState) -> AgentState:
     Node 3: Analyze root cause using LLM
     Uses LLM to understand what went wrong and why
     """
-    print("🧠 [Node 3] Analyzing root cause with LLM...")
+    log.info("🧠 [Node 3] Analyzing root cause with LLM...")
     
     if not state["context_success"]:
         return state
     
     try:
-        # Get LLM provider
-        provider = LLMProviderFactory.create(state["provider"])
+        # Get LLM provider (shared instance - reuses the SDK client's
+        # connection pool across nodes)
+        provider = LLMProviderFactory.get_cached(state["provider"])
         
         parsed = state["parsed_error"]
         context = state["code_context"]
         
-        # Build prompt
-        user_prompt = AgentPrompts.ROOT_CAUSE_USER.format(
+        # Format the primary-file context once - it appears in both the
+        # root-cause prefix and the fix-generation prefix below
+        primary_ctx = AgentPrompts.format_file_context(context.primary_files, max_files=2)
+
+        # Build prompt: stable blocks first, per-call fields at the
+        # tail, so the provider's prefix cache covers the file contexts
+        prompt_prefix = AgentPrompts.render_root_cause_prefix(
             language=parsed.language,
             framework=parsed.framework or "None",
+            primary_files_context=primary_ctx,
+            related_files_context=AgentPrompts.format_file_context(context.related_files, max_files=2),
+            config_files_context=AgentPrompts.format_file_context(context.config_files, max_files=2)
+        )
+        prompt_suffix = AgentPrompts.render_root_cause_suffix(
             error_type=parsed.error_type,
             severity=parsed.severity,
             category=parsed.category,
             message=parsed.message,
             stack_trace=AgentPrompts.format_stack_trace(parsed),
-            primary_files_context=AgentPrompts.format_file_context(context.primary_files, max_files=2),
-            related_files_context=AgentPrompts.format_file_context(context.related_files, max_files=2),
-            config_files_context=AgentPrompts.format_file_context(context.config_files, max_files=2),
             git_changes=AgentPrompts.format_git_changes(context.primary_files)
         )
-        
-        # Call LLM
-        response = provider.generate(
+
+        # Node 4's prompt prefix only depends on context gathered in
+        # node 2, so assemble it here from the already-formatted
+        # context instead of re-concatenating the files in node 4
+        fix_prompt_prefix = AgentPrompts.render_fix_generation_prefix(
+            language=parsed.language,
+            code_context=primary_ctx
+        )
+
+        # Call LLM, consuming the response as it streams
+        analysis = ''.join(provider.generate_stream(
             system_prompt=AgentPrompts.ROOT_CAUSE_SYSTEM,
-            user_prompt=user_prompt,
+            user_prompt=[prompt_prefix, prompt_suffix],
             temperature=0.3,
             max_tokens=1000
-        )
-        
-        state["root_cause_analysis"] = response.content
+        ))
+
+        state["root_cause_analysis"] = analysis
+        state["fix_prompt_prefix"] = fix_prompt_prefix
         state["analysis_success"] = True
         state["status"] = "generating"
-        
-        print(f"   ✅ Analysis complete ({response.tokens_used} tokens)")
-        print(f"   📝 Root cause: {response.content[:100]}...")
+
+        log.info("   ✅ Analysis complete (%d chars)", len(analysis))
+        log.info("   📝 Root cause: %.100s...", analysis)
         
     except Exception as e:
         state["analysis_success"] = False
         state["status"] = "failed"
         state["error_message"] = f"Failed to analyze: {str(e)}"
-        print(f"   ❌ Analysis failed: {e}")
+        log.error("   ❌ Analysis failed: %s", e)
     
     return state
 
@@ -137,30 +200,34 @@ def generate_fixes_node(state: AgentState) -> AgentState:
     Node 4: Generate fix suggestions
     Uses LLM to create concrete code patches
     """
-    print("🔧 [Node 4] Generating fix suggestions...")
+    log.info("🔧 [Node 4] Generating fix suggestions...")
     
     if not state["analysis_success"]:
         return state
     
     try:
-        provider = LLMProviderFactory.create(state["provider"])
-        
+        provider = LLMProviderFactory.get_cached(state["provider"])
+
         parsed = state["parsed_error"]
         context = state["code_context"]
         
-        # Build code context string
-        code_context_str = AgentPrompts.format_file_context(
-            context.primary_files,
-            max_files=2
-        )
-        
-        # Build prompt
-        user_prompt = AgentPrompts.FIX_GENERATION_USER.format(
+        # Use the prefix assembled in node 3; the bytes are
+        # shared with refine_fixes so a retry hits the provider's
+        # prefix cache
+        prompt_prefix = state["fix_prompt_prefix"]
+        if prompt_prefix is None:
+            prompt_prefix = AgentPrompts.render_fix_generation_prefix(
+                language=parsed.language,
+                code_context=AgentPrompts.format_file_context(
+                    context.primary_files,
+                    max_files=2
+                )
+            )
+            state["fix_prompt_prefix"] = prompt_prefix
+        prompt_suffix = AgentPrompts.render_fix_generation_suffix(
             root_cause_analysis=state["root_cause_analysis"],
-            language=parsed.language,
             error_type=parsed.error_type,
-            message=parsed.message,
-            code_context=code_context_str
+            message=parsed.message
         )
         
         # Define JSON schema
@@ -180,7 +247,7 @@ def generate_fixes_node(state: AgentState) -> AgentState:
         # Call LLM with JSON mode
         response_json = provider.generate_json(
             system_prompt=AgentPrompts.FIX_GENERATION_SYSTEM,
-            user_prompt=user_prompt,
+            user_prompt=[prompt_prefix, prompt_suffix],
             schema=schema
         )
         
@@ -190,97 +257,202 @@ def generate_fixes_node(state: AgentState) -> AgentState:
         
         for fix_data in fixes_data:
             try:
-                fix = FixSuggestion(**fix_data)
-                if fix.confidence >= 0.7:  # Only keep high-confidence fixes
-                    fixes.append(fix)
+                # Filter on the raw value first - below-threshold
+                # candidates never pay for dataclass construction
+                if float(fix_data.get("confidence", 0.0)) >= 0.7:
+                    fixes.append(FixSuggestion.from_dict(fix_data))
             except Exception as e:
-                print(f"   ⚠️  Skipped invalid fix: {e}")
+                log.warning("   ⚠️  Skipped invalid fix: %s", e)
                 continue
         
         state["fix_suggestions"] = fixes
         state["generation_success"] = True
         state["status"] = "validating"
         
-        print(f"   ✅ Generated {len(fixes)} fix suggestion(s)")
+        log.info("   ✅ Generated %d fix suggestion(s)", len(fixes))
         for i, fix in enumerate(fixes, 1):
-            print(f"   {i}. {fix.file_path} (confidence: {fix.confidence:.2f})")
+            log.info("   %d. %s (confidence: %.2f)", i, fix.file_path, fix.confidence)
         
     except Exception as e:
         state["generation_success"] = False
         state["status"] = "failed"
         state["error_message"] = f"Failed to generate fixes: {str(e)}"
-        print(f"   ❌ Fix generation failed: {e}")
+        log.error("   ❌ Fix generation failed: %s", e)
     
     return state
 
 
+# Structural shapes that mark a snippet as plausible Python even when
+# it doesn't parse standalone; compiled once instead of K substring
+# scans per fix
+_PY_STRUCTURE_RE = re.compile(r'\b(?:def|class|if|for|while|try)\b|=')
+
+_FIX_BREAK = "\n# ---FIXBREAK---\n"
+
+
+def _fix_key(fix: FixSuggestion) -> str:
+    """
+    Fix identity for the cross-retry validation cache
+
+    The anchor snippet is part of the identity: validation compares
+    original against new, so a refinement that only corrects the
+    anchor is a genuinely different fix, not a repeat.
+    """
+    return hashlib.blake2b(
+        f"{fix.file_path}\x00{fix.original_snippet}\x00{fix.new_snippet}".encode(),
+        digest_size=16
+    ).hexdigest()
+
+
+def _single_line_ok(snippet: str) -> bool:
+    """
+    Syntax-check a one-line snippet with compile() instead of ast.parse
+
+    compile() skips building Python AST objects, which makes it about
+    2x faster on small inputs. eval mode is tried first (most one-line
+    fixes are expressions), then exec for statements.
+    """
+    for mode in ('eval', 'exec'):
+        try:
+            compile(snippet, '<fix>', mode)
+            return True
+        except SyntaxError:
+            continue
+    return False
+
+
+def _batch_parse_ok(snippets):
+    """
+    Syntax-check all snippets with at most one ast.parse
+
+    One-line snippets go through the cheaper compile() check; the
+    multi-line rest are joined and parsed in a single pass when every
+    snippet is valid (the common case), with per-snippet parsing only
+    on failure to find the guilty ones.
+
+    Returns:
+        List of bools, one per snippet
+    """
+    oks = [None] * len(snippets)
+    multi = []
+    for i, snippet in enumerate(snippets):
+        if '\n' not in snippet:
+            oks[i] = _single_line_ok(snippet)
+        else:
+            multi.append(i)
+
+    if multi:
+        try:
+            ast.parse(_FIX_BREAK.join(snippets[i] for i in multi))
+            for i in multi:
+                oks[i] = True
+        except SyntaxError:
+            for i in multi:
+                try:
+                    ast.parse(snippets[i])
+                    oks[i] = True
+                except SyntaxError:
+                    oks[i] = False
+    return oks
+
+
+def _validate_one_fix(fix: FixSuggestion, language: str, parses: bool = True):
+    """
+    Run the per-fix validation checks (relaxed for code snippets)
+
+    Args:
+        fix: The suggestion to check
+        language: Error language ("python" enables the syntax check)
+        parses: Result of the batched syntax check for this snippet
+
+    Returns:
+        (is_valid, error_msg) tuple
+    """
+    # Check 1: File path is not empty
+    if not fix.file_path:
+        return False, "Empty file path"
+
+    # Check 2: Snippets are not empty
+    if not fix.original_snippet or not fix.new_snippet:
+        return False, "Empty code snippet"
+
+    # Check 3: Snippets are different
+    if fix.original_snippet.strip() == fix.new_snippet.strip():
+        return False, "Fix doesn't change anything"
+
+    # Check 4: Very basic syntax check (more lenient)
+    # The parse itself already ran batched; a snippet that didn't
+    # parse standalone is still allowed when it looks like a valid
+    # Python fragment (e.g. a single dedented line from a larger block)
+    if language == "python" and not parses:
+        if not _PY_STRUCTURE_RE.search(fix.new_snippet.strip()):
+            # Actually invalid
+            return False, "Invalid Python syntax"
+
+    return True, None
+
+
 def validate_fixes_node(state: AgentState) -> AgentState:
     """
     Node 5: Validate fix suggestions
     Checks basic validity of suggested fixes (relaxed for code snippets)
     """
-    print("✓ [Node 5] Validating fixes...")
-    
+    log.info("✓ [Node 5] Validating fixes...")
+
     if not state["generation_success"] or not state["fix_suggestions"]:
         state["validation_success"] = False
         return state
-    
+
     try:
         validated_fixes = []
         failed_fixes = []
-        
-        for fix in state["fix_suggestions"]:
-            # Basic validation checks (more lenient now)
-            is_valid = True
-            error_msg = None
-            
-            # Check 1: File path is not empty
-            if not fix.file_path:
-                is_valid = False
-                error_msg = "Empty file path"
-            
-            # Check 2: Snippets are not empty
-            elif not fix.original_snippet or not fix.new_snippet:
-                is_valid = False
-                error_msg = "Empty code snippet"
-            
-            # Check 3: Snippets are different
-            elif fix.original_snippet.strip() == fix.new_snippet.strip():
-                is_valid = False
-                error_msg = "Fix doesn't change anything"
-            
-            # Check 4: Very basic syntax check (more lenient)
-            # Only check if the new snippet is reasonably structured
-            elif state["parsed_error"].language == "python":
-                # Try to validate, but be lenient with incomplete code
-                try:
-                    # Remove leading whitespace to avoid indentation errors
-                    dedented_code = fix.new_snippet.strip()
-                    
-                    # Try to parse - but don't fail if it's a snippet
-                    try:
-                        import ast
-                        ast.parse(dedented_code)
-                    except SyntaxError:
-                        # If it fails, check if it's just a snippet (e.g., single line)
-                        # Allow it if it looks like valid Python structure
-                        if any(keyword in dedented_code for keyword in ['def ', 'class ', 'if ', 'for ', 'while ', 'try:', '=']):
-                            # Looks like valid Python structure, allow it
-                            pass
-                        else:
-                            # Actually invalid
-                            is_valid = False
-                            error_msg = "Invalid Python syntax"
-                except:
-                    # If we can't check, just allow it
-                    pass
-            
+
+        fixes = state["fix_suggestions"]
+        language = state["parsed_error"].language
+
+        # Verdicts persist across retry iterations - regeneration often
+        # repeats a previous attempt's fix verbatim, and re-parsing an
+        # already-judged snippet buys nothing
+        cache = state["validation_cache"]
+        if cache is None:
+            cache = state["validation_cache"] = {}
+        keys = [_fix_key(f) for f in fixes]
+        new_fixes = [f for f, k in zip(fixes, keys) if k not in cache]
+
+        if new_fixes:
+            # One ast.parse covers every snippet (per-snippet parsing
+            # only happens when the joined buffer fails)
+            if language == "python":
+                parse_ok = _batch_parse_ok([f.new_snippet.strip() for f in new_fixes])
+            else:
+                parse_ok = repeat(True)
+
+            # Fixes are independent, so check them concurrently;
+            # results come back in order so the output below stays
+            # deterministic
+            if len(new_fixes) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(max_workers=len(new_fixes)) as pool:
+                    results = list(pool.map(
+                        _validate_one_fix, new_fixes, repeat(language), parse_ok
+                    ))
+            else:
+                results = [
+                    _validate_one_fix(fix, language, ok)
+                    for fix, ok in zip(new_fixes, parse_ok)
+                ]
+
+            for fix, result in zip(new_fixes, results):
+                cache[_fix_key(fix)] = result
+
+        for fix, (is_valid, error_msg) in zip(fixes, (cache[k] for k in keys)):
             if is_valid:
                 validated_fixes.append(fix)
-                print(f"   ✅ Valid: {fix.file_path}")
+                log.info("   ✅ Valid: %s", fix.file_path)
             else:
                 failed_fixes.append((fix, error_msg))
-                print(f"   ❌ Invalid: {fix.file_path} - {error_msg}")
+                log.warning("   ❌ Invalid: %s - %s", fix.file_path, error_msg)
         
         # Create validation result
         validation_result = ValidationResult(
@@ -296,17 +468,17 @@ def validate_fixes_node(state: AgentState) -> AgentState:
         if validation_result.is_valid:
             state["final_fixes"] = validated_fixes
             state["status"] = "success"
-            print(f"   ✅ {len(validated_fixes)} fix(es) validated successfully")
+            log.info("   ✅ %d fix(es) validated successfully", len(validated_fixes))
         else:
             state["status"] = "refining"
             state["retry_feedback"] = "; ".join([msg for _, msg in failed_fixes])
-            print(f"   ⚠️  All fixes failed validation, will retry")
+            log.warning("   ⚠️  All fixes failed validation, will retry")
         
     except Exception as e:
         state["validation_success"] = False
         state["status"] = "failed"
         state["error_message"] = f"Validation failed: {str(e)}"
-        print(f"   ❌ Validation error: {e}")
+        log.error("   ❌ Validation error: %s", e)
     
     return state
 
@@ -317,44 +489,63 @@ def refine_fixes_node(state: AgentState) -> AgentState:
     Node 6: Refine fixes with feedback
     Regenerates fixes using validation feedback
     """
-    print("🔄 [Node 6] Refining fixes with feedback...")
+    log.info("🔄 [Node 6] Refining fixes with feedback...")
     
     # Check retry limit
     if state["retry_count"] >= state["max_retries"]:
         state["status"] = "failed"
         state["error_message"] = f"Max retries ({state['max_retries']}) reached"
-        print(f"   ❌ Max retries reached")
+        log.error("   ❌ Max retries reached")
         return state
     
     state["retry_count"] += 1
-    print(f"   🔄 Retry attempt {state['retry_count']}/{state['max_retries']}")
+    log.info("   🔄 Retry attempt %d/%d", state["retry_count"], state["max_retries"])
     
     try:
-        provider = LLMProviderFactory.create(state["provider"])
-        
-        # Build refinement prompt
-        previous_fix_str = json.dumps(
-            [fix.dict() for fix in state["fix_suggestions"]],
-            indent=2
-        )
-        
-        code_context_str = AgentPrompts.format_file_context(
-            state["code_context"].primary_files,
-            max_files=2
-        )
-        
-        user_prompt = AgentPrompts.REFINEMENT_USER.format(
+        provider = LLMProviderFactory.get_cached(state["provider"])
+
+        # Build refinement prompt. Only compact handles go back to the
+        # LLM - the full snippets already sit in the cached code
+        # context, so re-sending their bodies would just grow the
+        # prompt tail and burn tokens every retry
+        validation = state["validation_result"]
+        if validation and validation.failed_fixes:
+            failed = [
+                {"file": fix.file_path, "line": fix.line_number, "error": err}
+                for fix, err in validation.failed_fixes
+            ]
+        else:
+            failed = [
+                {"file": fix.file_path, "line": fix.line_number}
+                for fix in state["fix_suggestions"]
+            ]
+        previous_fix_str = _dumps_compact(failed)
+        
+        # Same prefix bytes as generate_fixes_node, feedback at the
+        # tail. The first attempt's call already warmed the provider's
+        # implicit prefix cache with these bytes; neither backend
+        # offers a cheaper explicit prime (a priming request bills as a
+        # full completion), so no speculative warmup is issued.
+        prompt_prefix = state["fix_prompt_prefix"]
+        if prompt_prefix is None:
+            prompt_prefix = AgentPrompts.render_fix_generation_prefix(
+                language=state["parsed_error"].language,
+                code_context=AgentPrompts.format_file_context(
+                    state["code_context"].primary_files,
+                    max_files=2
+                )
+            )
+        prompt_suffix = AgentPrompts.render_refinement_suffix(
             previous_fix=previous_fix_str,
             validation_feedback=state["retry_feedback"],
             error_type=state["parsed_error"].error_type,
-            message=state["parsed_error"].message,
-            code_context=code_context_str
+            message=state["parsed_error"].message
         )
-        
+
         # Generate refined fixes
         response_json = provider.generate_json(
             system_prompt=AgentPrompts.REFINEMENT_SYSTEM,
-            user_prompt=user_prompt,
+            user_prompt=[prompt_prefix, prompt_suffix],
             schema={"fixes": []}
         )
         
@@ -364,21 +555,30 @@ def refine_fixes_node(state: AgentState) -> AgentState:
         
         for fix_data in fixes_data:
             try:
-                fix = FixSuggestion(**fix_data)
-                if fix.confidence >= 0.7:
-                    refined_fixes.append(fix)
+                if float(fix_data.get("confidence", 0.0)) >= 0.7:
+                    refined_fixes.append(FixSuggestion.from_dict(fix_data))
             except:
                 continue
         
+        # A refinement that reproduces the rejected attempt verbatim
+        # will fail validation the same way - stop instead of burning
+        # the remaining retries on an LLM stuck in a loop
+        prev_keys = {_fix_key(f) for f in state["fix_suggestions"] or []}
+        if refined_fixes and {_fix_key(f) for f in refined_fixes} == prev_keys:
+            state["status"] = "failed"
+            state["error_message"] = "Refinement repeated the rejected fixes (LLM stuck in a loop)"
+            log.error("   ❌ Refined fixes identical to previous attempt, stopping")
+            return state
+
         state["fix_suggestions"] = refined_fixes
         state["generation_success"] = True
         state["status"] = "validating"
-        
-        print(f"   ✅ Generated {len(refined_fixes)} refined fix(es)")
+
+        log.info("   ✅ Generated %d refined fix(es)", len(refined_fixes))
         
     except Exception as e:
         state["status"] = "failed"
         state["error_message"] = f"Refinement failed: {str(e)}"
-        print(f"   ❌ Refinement failed: {e}")
+        log.error("   ❌ Refinement failed: %s", e)
     
     return state
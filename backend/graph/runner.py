@@ -3,14 +3,51 @@ Graph Runner
 Executes the agent workflow and handles results
 """
 
+import atexit
+import logging
+import queue
+import sys
 import time
-from typing import Dict, Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
 from pathlib import Path
 
 from .builder import build_agent_graph
 from .state import AgentState
 from backend.config import settings
 
+log = logging.getLogger(__name__)
+
+_log_listener = None
+
+
+def _configure_agent_logging() -> None:
+    """
+    Route backend.graph progress logging through a background thread
+
+    Emitting a record becomes a queue put; a QueueListener thread does
+    the formatting and stdout write. With print(), concurrent runs
+    (run_batch) all serialize on the stdio lock inside the workflow
+    nodes; with the queue they only contend on a lock-free enqueue.
+    Configured once per process, on first AgentRunner construction.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, handler)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+    agent_logger = logging.getLogger("backend.graph")
+    agent_logger.addHandler(QueueHandler(log_queue))
+    agent_logger.setLevel(logging.INFO)
+    agent_logger.propagate = False
+
 
 class AgentRunner:
     """
@@ -35,14 +72,17 @@ class AgentRunner:
         self.max_retries = max_retries
         self.project_root = project_root
         self.graph = build_agent_graph()
+        _configure_agent_logging()
     
-    def run(self, error_log: str) -> Dict:
+    def run(self, error_log: str, on_progress=None) -> Dict:
         """
         Run the agent on an error log
-        
+
         Args:
             error_log: Raw error log text
-            
+            on_progress: Optional callback(node_name, state) invoked as
+                         each workflow node completes (enables live UIs)
+
         Returns:
             Final state dictionary with results
         """
@@ -65,11 +105,13 @@ class AgentRunner:
             "root_cause_analysis": None,
             "analysis_success": False,
             
+            "fix_prompt_prefix": None,
             "fix_suggestions": None,
             "generation_success": False,
             
             "validation_result": None,
             "validation_success": False,
+            "validation_cache": None,
             
             # Retry logic
             "retry_count": 0,
@@ -88,27 +130,35 @@ class AgentRunner:
         
         # Execute graph
         try:
-            print("\n" + "="*60)
-            print("🤖 Starting rootCauseAI")
-            print("="*60)
-            
-            final_state = self.graph.invoke(initial_state)
+            log.info("\n%s", "=" * 60)
+            log.info("🤖 Starting rootCauseAI")
+            log.info("=" * 60)
             
+            if on_progress is None:
+                final_state = self.graph.invoke(initial_state)
+            else:
+                # Stream node-by-node so the caller can update a live
+                # display instead of sitting on a blocking invoke()
+                final_state = initial_state
+                for chunk in self.graph.stream(initial_state):
+                    for node_name, node_state in chunk.items():
+                        final_state = node_state
+                        on_progress(node_name, node_state)
+
+
             # Calculate execution time
             final_state["execution_time"] = time.time() - start_time
             
-            print("\n" + "="*60)
-            print(f"✅ Agent finished in {final_state['execution_time']:.2f}s")
-            print(f"   Status: {final_state['status']}")
-            print(f"   Retries used: {final_state['retry_count']}/{self.max_retries}")
-            print("="*60 + "\n")
+            log.info("\n%s", "=" * 60)
+            log.info("✅ Agent finished in %.2fs", final_state["execution_time"])
+            log.info("   Status: %s", final_state["status"])
+            log.info("   Retries used: %d/%d", final_state["retry_count"], self.max_retries)
+            log.info("%s\n", "=" * 60)
             
             return final_state
             
         except Exception as e:
-            print(f"\n❌ Agent execution failed: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("\n❌ Agent execution failed: %s", e)
             
             return {
                 **initial_state,
@@ -117,6 +167,49 @@ class AgentRunner:
                 "execution_time": time.time() - start_time
             }
     
+    def run_batch(
+        self,
+        error_logs: List[str],
+        max_concurrency: int = 10
+    ) -> List[Dict]:
+        """
+        Run the agent on multiple error logs concurrently
+
+        Each log goes through the full workflow independently. A semaphore
+        bounds in-flight runs so N errors cost ~max(RTT) instead of N×RTT
+        without hammering provider rate limits.
+
+        Logs are deliberately not marshalled into one combined prompt:
+        that would couple unrelated failures in a single completion and
+        bypass the per-run validate/refine loop. Runs against the same
+        project already share their file-context prompt prefix through
+        the provider's prefix cache, which captures the amortization a
+        combined prompt would buy.
+
+        Args:
+            error_logs: List of raw error log texts
+            max_concurrency: Maximum concurrent agent runs
+
+        Returns:
+            List of final state dictionaries (same order as input)
+        """
+        import asyncio
+
+        if not error_logs:
+            return []
+
+        async def _run_all():
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _run_one(log: str) -> Dict:
+                async with semaphore:
+                    # Graph execution is synchronous, so push it to a thread
+                    return await asyncio.to_thread(self.run, log)
+
+            return await asyncio.gather(*[_run_one(log) for log in error_logs])
+
+        return list(asyncio.run(_run_all()))
+
     def run_and_display(self, error_log: str) -> Dict:
         """
         Run agent and display results in a formatted way
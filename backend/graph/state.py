@@ -3,41 +3,45 @@ Agent State Models
 Defines the state that flows through the LangGraph
 """
 
-from typing import TypedDict, List, Optional, Literal
+from dataclasses import asdict, dataclass, fields
+from typing import TypedDict, Dict, List, Optional, Literal
 from pydantic import BaseModel, Field
 
 from backend.parsers.base_parser import ParsedError
 from backend.context.context_builder import CodeContext
 
 
-class FixSuggestion(BaseModel):
-    """Represents a single code fix suggestion"""
-    
-    file_path: str = Field(description="Path to file to fix")
-    original_snippet: str = Field(description="Original code to replace")
-    new_snippet: str = Field(description="New corrected code")
-    explanation: str = Field(description="Why this fix works")
-    confidence: float = Field(
-        ge=0.0,
-        le=1.0,
-        description="Confidence in this fix (0-1)"
-    )
-    line_number: Optional[int] = Field(
-        default=None,
-        description="Approximate line number"
-    )
-    
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "file_path": "src/main.py",
-                "original_snippet": "result = x + y",
-                "new_snippet": "result = int(x) + int(y)",
-                "explanation": "Convert strings to integers before addition",
-                "confidence": 0.95,
-                "line_number": 42
-            }
-        }
+@dataclass(slots=True)
+class FixSuggestion:
+    """
+    Represents a single code fix suggestion
+
+    A slots dataclass rather than a pydantic model: instances are built
+    in a loop from our own generate_json output, where full per-field
+    validation buys nothing over the confidence clamp below and costs
+    several times the construction time.
+    """
+
+    file_path: str
+    original_snippet: str
+    new_snippet: str
+    explanation: str
+    confidence: float
+    line_number: Optional[int] = None
+
+    def __post_init__(self):
+        # Replaces pydantic's ge/le bounds on confidence
+        self.confidence = max(0.0, min(1.0, float(self.confidence)))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FixSuggestion":
+        """Build from LLM JSON, ignoring unknown keys like pydantic did"""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+    def dict(self) -> dict:
+        """Plain-dict view (keeps the pydantic-era call sites working)"""
+        return asdict(self)
 
 
 class ValidationResult(BaseModel):
@@ -82,12 +86,18 @@ class AgentState(TypedDict):
     analysis_success: bool
     
     # Step 4: Generate fixes
+    # fix_prompt_prefix is assembled once in step 3 (sharing its
+    # formatted file context) so step 4 and retries never rebuild it
+    fix_prompt_prefix: Optional[str]
     fix_suggestions: Optional[List[FixSuggestion]]
     generation_success: bool
     
     # Step 5: Validate fixes
+    # validation_cache maps a fix identity hash to its (is_valid,
+    # error) verdict so retry iterations skip re-validating repeats
     validation_result: Optional[ValidationResult]
     validation_success: bool
+    validation_cache: Optional[Dict[str, tuple]]
     
     # Retry logic
     retry_count: int
@@ -4,9 +4,18 @@ Defines the interface that all LLM providers must implement
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence, Union
 from pydantic import BaseModel, Field
 
+# Prompts may be passed as an ordered sequence of blocks with the
+# static content first - both backends cache by literal prompt prefix
+# (Gemini implicit caching, Groq prefix cache), so keeping the shared
+# blocks byte-identical across calls lets repeat calls reuse cached KV.
+# No explicit persistent cache (Gemini CachedContent) is created: it
+# requires 32k+ cached tokens and the agent's whole context budget is
+# 8k, so typical prefixes are below the API's floor.
+PromptBlocks = Union[str, Sequence[str]]
+
 
 class LLMResponse(BaseModel):
     """Standardized response from any LLM provider"""
@@ -60,20 +69,29 @@ class BaseLLMProvider(ABC):
         """
         pass
     
+    @staticmethod
+    def _join_blocks(prompt: PromptBlocks) -> str:
+        """Flatten a prompt-block sequence, preserving block order"""
+        if isinstance(prompt, str):
+            return prompt
+        return "\n\n".join(prompt)
+
     @abstractmethod
     def generate(
         self,
         system_prompt: str,
-        user_prompt: str,
+        user_prompt: PromptBlocks,
         temperature: float = 0.3,
         max_tokens: int = 2000
     ) -> LLMResponse:
         """
         Generate text response from the LLM
-        
+
         Args:
             system_prompt: System instructions (sets behavior/role)
-            user_prompt: User's actual query/request
+            user_prompt: User's actual query/request - a string, or an
+                ordered sequence of blocks (static prefix first) so the
+                provider's prefix cache can reuse the shared portion
             temperature: Randomness (0.0=deterministic, 1.0=creative)
             max_tokens: Maximum tokens to generate
             
@@ -89,15 +107,15 @@ class BaseLLMProvider(ABC):
     def generate_json(
         self,
         system_prompt: str,
-        user_prompt: str,
+        user_prompt: PromptBlocks,
         schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate structured JSON response from the LLM
-        
+
         Args:
             system_prompt: System instructions
-            user_prompt: User's query
+            user_prompt: User's query (string or ordered block sequence)
             schema: Optional JSON schema for validation
             
         Returns:
@@ -108,6 +126,26 @@ class BaseLLMProvider(ABC):
         """
         pass
     
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: PromptBlocks,
+        temperature: float = 0.3,
+        max_tokens: int = 2000
+    ):
+        """
+        Generate a response as an iterator of text deltas
+
+        Callers can overlap work with the network transfer instead of
+        blocking on the full completion. The default implementation
+        falls back to one blocking generate() call yielding a single
+        delta; providers with SDK streaming support override it.
+
+        Yields:
+            Text fragments in arrival order
+        """
+        yield self.generate(system_prompt, user_prompt, temperature, max_tokens).content
+
     def get_provider_name(self) -> str:
         """Get the name of this provider"""
         return self.__class__.__name__.replace("Provider", "").lower()
@@ -5,10 +5,23 @@ Uses Google's Generative AI SDK for Gemini models
 
 import google.generativeai as genai
 from google.generativeai.types import GenerationConfig, HarmCategory, HarmBlockThreshold
-from .base_provider import BaseLLMProvider, LLMResponse
+from .base_provider import BaseLLMProvider, LLMResponse, PromptBlocks
 from typing import Dict, Any, Optional
 import json
 
+# orjson parses multi-KB LLM responses several times faster than the
+# stdlib; optional with a json fallback, like elsewhere in the codebase
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+# except clauses below work with either parser)
+try:
+    import orjson
+
+    def _json_loads(text):
+        return orjson.loads(text)
+except ImportError:
+    def _json_loads(text):
+        return json.loads(text)
+
 
 class GeminiProvider(BaseLLMProvider):
     """
@@ -18,6 +31,9 @@ class GeminiProvider(BaseLLMProvider):
     
     def _validate_setup(self) -> None:
         """Configure Gemini API"""
+        # Transport is gRPC (HTTP/2 with stream multiplexing) over a
+        # channel the SDK shares per process, so connection reuse
+        # comes for free with the factory-cached provider instance
         try:
             genai.configure(api_key=self.api_key)
             # Create model instance
@@ -36,25 +52,26 @@ class GeminiProvider(BaseLLMProvider):
     def generate(
         self,
         system_prompt: str,
-        user_prompt: str,
+        user_prompt: PromptBlocks,
         temperature: float = 0.3,
         max_tokens: int = 2000
     ) -> LLMResponse:
         """
         Generate text response using Gemini
-        
+
         Args:
             system_prompt: System instructions
-            user_prompt: User query
+            user_prompt: User query (string or static-prefix-first blocks)
             temperature: Randomness level
             max_tokens: Maximum output tokens
-            
+
         Returns:
             LLMResponse with generated content
         """
         try:
-            # Combine system and user prompts
-            full_prompt = f"{system_prompt}\n\n{user_prompt}"
+            # Combine system and user prompts; block order is kept so a
+            # byte-stable prefix hits Gemini's implicit context cache
+            full_prompt = f"{system_prompt}\n\n{self._join_blocks(user_prompt)}"
             
             # Configure generation
             generation_config = GenerationConfig(
@@ -92,30 +109,71 @@ class GeminiProvider(BaseLLMProvider):
         except Exception as e:
             raise Exception(f"Gemini generation failed: {str(e)}")
     
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: PromptBlocks,
+        temperature: float = 0.3,
+        max_tokens: int = 2000
+    ):
+        """
+        Stream text deltas from Gemini as they arrive
+
+        Yields:
+            Text fragments in arrival order
+        """
+        try:
+            full_prompt = f"{system_prompt}\n\n{self._join_blocks(user_prompt)}"
+
+            generation_config = GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens,
+                top_p=0.95,
+                top_k=40,
+            )
+
+            response = self.client.generate_content(
+                full_prompt,
+                generation_config=generation_config,
+                stream=True
+            )
+
+            for chunk in response:
+                try:
+                    if chunk.text:
+                        yield chunk.text
+                except ValueError:
+                    # Chunks without text parts (e.g. safety metadata)
+                    continue
+
+        except Exception as e:
+            raise Exception(f"Gemini streaming failed: {str(e)}")
+
     def generate_json(
         self,
         system_prompt: str,
-        user_prompt: str,
+        user_prompt: PromptBlocks,
         schema: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """
         Generate structured JSON response using Gemini
-        
+
         Args:
             system_prompt: System instructions
-            user_prompt: User query
+            user_prompt: User query (string or static-prefix-first blocks)
             schema: Optional JSON schema
-            
+
         Returns:
             Parsed JSON dictionary
         """
         try:
-            # Add JSON instruction to prompt
+            # Add JSON instruction to prompt (as a suffix - it never
+            # disturbs the cacheable prefix)
             json_instruction = "\n\nYou must respond with valid JSON only. No markdown, no explanations, no code blocks."
             if schema:
                 json_instruction += f"\n\nFollow this schema exactly:\n{json.dumps(schema, indent=2)}"
-            
-            full_prompt = f"{system_prompt}\n\n{user_prompt}{json_instruction}"
+
+            full_prompt = f"{system_prompt}\n\n{self._join_blocks(user_prompt)}{json_instruction}"
             
             # Configure for JSON output
             generation_config = GenerationConfig(
@@ -135,7 +193,7 @@ class GeminiProvider(BaseLLMProvider):
             
             # Try 1: Direct JSON parse
             try:
-                return json.loads(response_text)
+                return _json_loads(response_text)
             except json.JSONDecodeError:
                 pass
             
@@ -148,7 +206,7 @@ class GeminiProvider(BaseLLMProvider):
                 response_text = response_text.strip()
                 
                 try:
-                    return json.loads(response_text)
+                    return _json_loads(response_text)
                 except json.JSONDecodeError:
                     pass
             
@@ -161,7 +219,7 @@ class GeminiProvider(BaseLLMProvider):
                 # Try the largest match
                 largest_match = max(matches, key=len)
                 try:
-                    return json.loads(largest_match)
+                    return _json_loads(largest_match)
                 except json.JSONDecodeError:
                     pass
             
@@ -173,7 +231,7 @@ class GeminiProvider(BaseLLMProvider):
             response_text = re.sub(r',\s*]', ']', response_text)
             
             try:
-                return json.loads(response_text)
+                return _json_loads(response_text)
             except json.JSONDecodeError as e:
                 # Last resort: return error structure
                 print(f"⚠️  JSON parsing failed after all attempts. Error: {e}")
@@ -6,6 +6,28 @@ Uses Groq's ultra-fast inference API
 from typing import Dict, Any, Optional
 import json
 
+import httpx
+
+# HTTP/2 multiplexes concurrent calls over one TLS session, but needs
+# the optional h2 package; without it the pooled client still reuses
+# connections via HTTP/1.1 keep-alive
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Optional orjson fast path for parsing responses, stdlib fallback -
+# same pattern as the Gemini provider
+try:
+    import orjson
+
+    def _json_loads(text):
+        return orjson.loads(text)
+except ImportError:
+    def _json_loads(text):
+        return json.loads(text)
+
 
 class GroqProvider:
     """
@@ -24,16 +46,28 @@ class GroqProvider:
     
     def _validate_setup(self) -> None:
         """Initialize Groq client with minimal parameters"""
+        self._http = None
         try:
             # Import here to avoid issues
             from groq import Groq
-            
-            # Create client with only the API key
-            # This avoids the 'proxies' parameter issue
+
+            # One pooled HTTP client for the provider's lifetime: with
+            # the factory caching provider instances, every LLM call in
+            # a run rides the same warm TLS session instead of paying a
+            # fresh handshake (~30-100ms) per node
+            self._http = httpx.Client(
+                http2=_HTTP2,
+                timeout=60.0,
+                limits=httpx.Limits(
+                    max_keepalive_connections=8,
+                    max_connections=16
+                )
+            )
             self.client = Groq(
-                api_key=self.api_key
+                api_key=self.api_key,
+                http_client=self._http
             )
-            
+
         except TypeError as e:
             # If still failing, try environment variable method
             import os
@@ -68,7 +102,12 @@ class GroqProvider:
         try:
             # Import here
             from .base_provider import LLMResponse
-            
+
+            # Blocks arrive static-prefix-first; joining in order keeps
+            # the prefix byte-stable for Groq's prefix cache
+            if not isinstance(user_prompt, str):
+                user_prompt = "\n\n".join(user_prompt)
+
             # Create chat completion
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -101,6 +140,43 @@ class GroqProvider:
         except Exception as e:
             raise Exception(f"Groq generation failed: {str(e)}")
     
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt,
+        temperature: float = 0.3,
+        max_tokens: int = 2000
+    ):
+        """
+        Stream text deltas from Groq as they arrive
+
+        Yields:
+            Text fragments in arrival order
+        """
+        try:
+            if not isinstance(user_prompt, str):
+                user_prompt = "\n\n".join(user_prompt)
+
+            stream = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                top_p=0.95,
+                stream=True
+            )
+
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+        except Exception as e:
+            raise Exception(f"Groq streaming failed: {str(e)}")
+
     def generate_json(
         self,
         system_prompt: str,
@@ -119,11 +195,15 @@ class GroqProvider:
             Parsed JSON dictionary
         """
         try:
-            # Add JSON instruction
+            if not isinstance(user_prompt, str):
+                user_prompt = "\n\n".join(user_prompt)
+
+            # Add JSON instruction (suffix - leaves the cacheable
+            # prompt prefix untouched)
             json_instruction = "\n\nRespond with valid JSON only. No markdown formatting."
             if schema:
                 json_instruction += f"\n\nSchema:\n{json.dumps(schema, indent=2)}"
-            
+
             full_user_prompt = f"{user_prompt}{json_instruction}"
             
             # Create chat completion with JSON mode
@@ -148,7 +228,7 @@ class GroqProvider:
             content = response.choices[0].message.content
             
             try:
-                return json.loads(content)
+                return _json_loads(content)
             except json.JSONDecodeError:
                 # Try to clean up response
                 content = content.strip()
@@ -159,11 +239,16 @@ class GroqProvider:
                 if content.endswith("```"):
                     content = content[:-3]
                 
-                return json.loads(content.strip())
+                return _json_loads(content.strip())
                 
         except Exception as e:
             raise Exception(f"Groq JSON generation failed: {str(e)}")
     
+    def close(self) -> None:
+        """Release the pooled HTTP connections"""
+        if self._http is not None:
+            self._http.close()
+
     def get_provider_name(self) -> str:
         """Get the name of this provider"""
         return "groq"
@@ -3,6 +3,7 @@ Factory Pattern for LLM Provider Creation
 Simplifies switching between different LLM providers
 """
 
+from functools import lru_cache
 from typing import Optional
 from .base_provider import BaseLLMProvider
 from .gemini_provider import GeminiProvider
@@ -72,6 +73,24 @@ class LLMProviderFactory:
         except Exception as e:
             raise ValueError(f"Failed to create {provider_name} provider: {e}")
     
+    @classmethod
+    def get_cached(cls, provider: Optional[str] = None) -> BaseLLMProvider:
+        """
+        Get a shared provider instance, creating it on first use
+
+        Providers hold SDK clients with keep-alive connection pools, so
+        reusing one instance across workflow nodes skips repeated client
+        construction and TCP/TLS setup. Use create() when a caller
+        genuinely needs its own instance.
+
+        Args:
+            provider: Provider name, None for the configured default
+
+        Returns:
+            Cached LLM provider instance
+        """
+        return _cached_instance((provider or settings.default_provider).lower())
+
     @classmethod
     def list_providers(cls) -> list[str]:
         """Get list of available provider names"""
@@ -88,5 +107,11 @@ class LLMProviderFactory:
         """
         if not issubclass(provider_class, BaseLLMProvider):
             raise TypeError(f"{provider_class} must inherit from BaseLLMProvider")
-        
+
         cls._providers[name.lower()] = provider_class
+
+
+@lru_cache(maxsize=4)
+def _cached_instance(provider_name: str) -> BaseLLMProvider:
+    """One instance per provider name for the process lifetime"""
+    return LLMProviderFactory.create(provider_name)
@@ -3,6 +3,8 @@ Error Classifier
 Auto-detects error type and routes to appropriate parser
 """
 
+import hashlib
+from collections import OrderedDict
 from typing import List, Optional
 from .base_parser import BaseParser, ParsedError
 from .python_parser import PythonParser
@@ -11,6 +13,13 @@ from .typescript_parser import TypeScriptParser
 from .react_parser import ReactParser
 from .linter_parser import LinterParser
 
+# Scan bounds: the useful signals (error type, top frames, framework
+# hints) sit in the first few KB, so multi-MB CI logs are truncated
+# before detection/parsing instead of scanned end to end - the same
+# spirit as the raw_error=error_log[:500] slice the parsers keep
+_DETECT_BYTES = 65536
+_PARSE_BYTES = 262144
+
 
 class ErrorClassifier:
     """
@@ -27,6 +36,15 @@ class ErrorClassifier:
             JavaScriptParser(),
             LinterParser(),
         ]
+
+        # Repeat parses of an identical log (watch mode, re-runs) are
+        # served from a small LRU keyed by log digest. A manual cache
+        # rather than lru_cache: ParsedError is mutable, so hits must
+        # hand out deep copies to keep callers isolated
+        self._parse_cache: OrderedDict[bytes, ParsedError] = OrderedDict()
+        self._cache_max = 256
+        self._hits = 0
+        self._misses = 0
     
     def classify_and_parse(self, error_log: str) -> ParsedError:
         """
@@ -43,14 +61,23 @@ class ErrorClassifier:
         """
         if not error_log or not error_log.strip():
             raise ValueError("Error log is empty")
-        
+
+        key = hashlib.blake2b(error_log.encode(), digest_size=16).digest()
+        cached = self._parse_cache.get(key)
+        if cached is not None:
+            self._parse_cache.move_to_end(key)
+            self._hits += 1
+            return cached.model_copy(deep=True)
+        self._misses += 1
+
         # Find best parser based on confidence scores
         best_parser = None
         best_confidence = 0.0
         parser_scores = {}
-        
+        detect_log = error_log[:_DETECT_BYTES]
+
         for parser in self.parsers:
-            confidence = parser.can_parse(error_log)
+            confidence = parser.can_parse(detect_log)
             parser_name = parser.get_parser_name()
             parser_scores[parser_name] = confidence
             
@@ -69,12 +96,25 @@ class ErrorClassifier:
         
         # Parse with best parser
         try:
-            parsed_error = best_parser.parse(error_log)
+            parsed_error = best_parser.parse(error_log[:_PARSE_BYTES])
             # Update confidence with classifier's score
             parsed_error.confidence = best_confidence
-            return parsed_error
         except Exception as e:
             raise ValueError(f"Failed to parse with {best_parser.get_parser_name()}: {e}")
+
+        self._parse_cache[key] = parsed_error.model_copy(deep=True)
+        if len(self._parse_cache) > self._cache_max:
+            self._parse_cache.popitem(last=False)
+        return parsed_error
+
+    def cache_info(self) -> dict:
+        """Parse-cache statistics (for debugging)"""
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "size": len(self._parse_cache),
+            "max_size": self._cache_max,
+        }
     
     def get_parser_scores(self, error_log: str) -> dict[str, float]:
         """
@@ -87,9 +127,10 @@ class ErrorClassifier:
             Dictionary mapping parser names to confidence scores
         """
         scores = {}
+        detect_log = error_log[:_DETECT_BYTES]
         for parser in self.parsers:
             parser_name = parser.get_parser_name()
-            confidence = parser.can_parse(error_log)
+            confidence = parser.can_parse(detect_log)
             scores[parser_name] = confidence
         
         return scores
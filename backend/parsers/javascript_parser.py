@@ -7,6 +7,34 @@ import re
 from typing import Optional
 from .base_parser import BaseParser, ParsedError, StackFrame
 
+# Compiled once at import; see python_parser for rationale
+_INDICATOR_RE = re.compile(
+    r'(?P<err>(?:TypeError|ReferenceError|SyntaxError|RangeError):)'
+    r'|(?P<paren>at .+\(.*\.js:\d+:\d+\))'
+    r'|(?P<bare>at .*\.js:\d+:\d+)'
+    r'|(?P<node>node:internal|node_modules)'
+)
+_INDICATOR_WEIGHTS = {'err': 0.3, 'paren': 0.3, 'bare': 0.2, 'node': 0.2}
+
+# Both frame shapes in one alternation - parenthesized form first:
+#   at functionName (file.js:10:5)
+#   at file.js:10:5
+_FRAME_RE = re.compile(
+    r'at\s+(?:(?:(?P<fn>[^\n]+?)\s+)?\((?P<pfile>[^)\n]+):(?P<pline>\d+):(?P<pcol>\d+)\)'
+    r'|(?P<file>[^(\n]+):(?P<line>\d+):(?P<col>\d+))'
+)
+
+# Pattern: ErrorType: message
+_ERROR_RE = re.compile(r'^[ \t]*(\w+Error): (.+?)[ \t\r]*$', re.MULTILINE)
+
+_FRAMEWORK_RES = {
+    'express': re.compile(r'express[/\\]', re.IGNORECASE),
+    'react': re.compile(r'react-dom|react[/\\]', re.IGNORECASE),
+    'vue': re.compile(r'vue[/\\]', re.IGNORECASE),
+    'next': re.compile(r'next[/\\]', re.IGNORECASE),
+    'nest': re.compile(r'@nestjs', re.IGNORECASE),
+}
+
 
 class JavaScriptParser(BaseParser):
     """
@@ -21,19 +49,18 @@ class JavaScriptParser(BaseParser):
     
     def can_parse(self, error_log: str) -> float:
         """Detect if this is a JavaScript/Node.js error"""
-        indicators = [
-            (r'(TypeError|ReferenceError|SyntaxError|RangeError):', 0.3),
-            (r'at .+\(.*\.js:\d+:\d+\)', 0.3),
-            (r'at .*\.js:\d+:\d+', 0.2),
-            (r'node:internal|node_modules', 0.2),
-        ]
-        
         score = 0.0
-        for pattern, weight in indicators:
-            if re.search(pattern, error_log):
-                score += weight
-        
-        return min(score, 1.0)
+        seen = set()
+        for match in _INDICATOR_RE.finditer(error_log):
+            group = match.lastgroup
+            if group not in seen:
+                seen.add(group)
+                score += _INDICATOR_WEIGHTS[group]
+                if score >= 1.0:
+                    # Saturated - stop scanning the rest of the log
+                    return 1.0
+
+        return score
     
     def parse(self, error_log: str) -> ParsedError:
         """Parse JavaScript error"""
@@ -56,62 +83,43 @@ class JavaScriptParser(BaseParser):
     
     def _extract_stack_frames(self, error_log: str) -> list[StackFrame]:
         """Extract stack frames from JavaScript error"""
+        # Cheap substring prefilter before invoking the regex engine
+        if 'at ' not in error_log:
+            return []
+
         frames = []
-        
-        # Pattern 1: at functionName (file.js:10:5)
-        pattern1 = r'at\s+(?:(.+?)\s+)?\(([^)]+):(\d+):(\d+)\)'
-        
-        # Pattern 2: at file.js:10:5
-        pattern2 = r'at\s+([^(]+):(\d+):(\d+)'
-        
-        for line in error_log.split('\n'):
-            # Try pattern 1 first
-            match = re.search(pattern1, line)
-            if match:
-                function = match.group(1) or 'anonymous'
-                file_path = match.group(2)
-                line_num = int(match.group(3))
-                column = int(match.group(4))
-                
+
+        # One C-engine pass over the whole log instead of a Python
+        # loop trying each pattern per line
+        for match in _FRAME_RE.finditer(error_log):
+            if match.group('pfile'):
                 frames.append(StackFrame(
-                    file_path=file_path,
-                    line=line_num,
-                    column=column,
-                    function=function
+                    file_path=match.group('pfile'),
+                    line=int(match.group('pline')),
+                    column=int(match.group('pcol')),
+                    function=match.group('fn') or 'anonymous'
                 ))
-                continue
-            
-            # Try pattern 2
-            match = re.search(pattern2, line)
-            if match:
-                file_path = match.group(1).strip()
-                line_num = int(match.group(2))
-                column = int(match.group(3))
-                
+            else:
                 frames.append(StackFrame(
-                    file_path=file_path,
-                    line=line_num,
-                    column=column
+                    file_path=match.group('file').strip(),
+                    line=int(match.group('line')),
+                    column=int(match.group('col'))
                 ))
-        
+
         return frames
     
     def _extract_error_info(self, error_log: str) -> dict:
         """Extract error type and message"""
-        # Pattern: ErrorType: message
-        error_pattern = r'^(\w+Error): (.+?)$'
-        
-        for line in error_log.split('\n'):
-            match = re.match(error_pattern, line.strip())
-            if match:
-                return {
-                    'error_type': match.group(1),
-                    'message': match.group(2).strip()
-                }
-        
+        match = _ERROR_RE.search(error_log)
+        if match:
+            return {
+                'error_type': match.group(1),
+                'message': match.group(2).strip()
+            }
+
         return {
             'error_type': 'JavaScriptError',
-            'message': error_log.split('\n')[0][:200]
+            'message': error_log.partition('\n')[0][:200]
         }
     
     def _categorize_error(self, error_type: str) -> str:
@@ -127,16 +135,8 @@ class JavaScriptParser(BaseParser):
     
     def _detect_framework(self, error_log: str) -> Optional[str]:
         """Detect JavaScript framework"""
-        frameworks = {
-            'express': r'express[/\\]',
-            'react': r'react-dom|react[/\\]',
-            'vue': r'vue[/\\]',
-            'next': r'next[/\\]',
-            'nest': r'@nestjs',
-        }
-        
-        for framework, pattern in frameworks.items():
-            if re.search(pattern, error_log, re.IGNORECASE):
+        for framework, pattern in _FRAMEWORK_RES.items():
+            if pattern.search(error_log):
                 return framework
         
         return None
@@ -6,6 +6,18 @@ Handles ESLint, Prettier, and other linting errors
 import re
 from .base_parser import BaseParser, ParsedError, StackFrame
 
+# Compiled once at import; see python_parser for rationale
+_INDICATOR_RE = re.compile(
+    r'(?P<eslint>eslint)'
+    r'|(?P<prettier>prettier)'
+    r'|(?P<pos>\d+:\d+\s+(?:error|warning))',
+    re.IGNORECASE
+)
+_INDICATOR_WEIGHTS = {'eslint': 0.4, 'prettier': 0.4, 'pos': 0.2}
+
+# Pattern: file.js:10:5: error/warning - message
+_LINT_RE = re.compile(r'([^\s:]+):(\d+):(\d+):\s+(error|warning)\s+-\s+(.+)')
+
 
 class LinterParser(BaseParser):
     """
@@ -14,18 +26,18 @@ class LinterParser(BaseParser):
     
     def can_parse(self, error_log: str) -> float:
         """Detect if this is a linting error"""
-        indicators = [
-            (r'eslint', 0.4),
-            (r'prettier', 0.4),
-            (r'\d+:\d+\s+(error|warning)', 0.2),
-        ]
-        
         score = 0.0
-        for pattern, weight in indicators:
-            if re.search(pattern, error_log, re.IGNORECASE):
-                score += weight
-        
-        return min(score, 1.0)
+        seen = set()
+        for match in _INDICATOR_RE.finditer(error_log):
+            group = match.lastgroup
+            if group not in seen:
+                seen.add(group)
+                score += _INDICATOR_WEIGHTS[group]
+                if score >= 1.0:
+                    # Saturated - stop scanning the rest of the log
+                    return 1.0
+
+        return score
     
     def parse(self, error_log: str) -> ParsedError:
         """Parse linting error"""
@@ -45,25 +57,14 @@ class LinterParser(BaseParser):
     
     def _extract_lint_errors(self, error_log: str) -> list[StackFrame]:
         """Extract linting errors"""
-        frames = []
-        
-        # Pattern: file.js:10:5: error/warning - message
-        pattern = r'([^\s:]+):(\d+):(\d+):\s+(error|warning)\s+-\s+(.+)'
-        
-        for line in error_log.split('\n'):
-            match = re.search(pattern, line)
-            if match:
-                file_path = match.group(1)
-                line_num = int(match.group(2))
-                column = int(match.group(3))
-                severity = match.group(4)
-                message = match.group(5)
-                
-                frames.append(StackFrame(
-                    file_path=file_path,
-                    line=line_num,
-                    column=column,
-                    code_snippet=message
-                ))
-        
-        return frames
+        # One C-engine pass over the whole log (the pattern can't
+        # span lines, so per-line scanning bought nothing)
+        return [
+            StackFrame(
+                file_path=match.group(1),
+                line=int(match.group(2)),
+                column=int(match.group(3)),
+                code_snippet=match.group(5)
+            )
+            for match in _LINT_RE.finditer(error_log)
+        ]
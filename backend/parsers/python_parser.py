@@ -7,6 +7,36 @@ import re
 from typing import Optional
 from .base_parser import BaseParser, ParsedError, StackFrame
 
+# Compiled once at import - these run against every line of every
+# traceback, and routing through re's string-keyed internal cache
+# costs a dict lookup per call
+_INDICATOR_RE = re.compile(
+    r'(?P<tb>Traceback \(most recent call last\))'
+    r'|(?P<file>File ".*\.py", line \d+)'
+    r'|(?P<exc>(?:Error|Exception):)'
+    r'|(?P<kw>(?:raise|def|class|import)\s+)'
+)
+_INDICATOR_WEIGHTS = {'tb': 0.4, 'file': 0.3, 'exc': 0.2, 'kw': 0.1}
+
+# Pattern: File "path/file.py", line 42, in function_name
+# followed (optionally) by the echoed source line, captured in the
+# same match instead of peeking at lines[i + 1]
+_FRAME_RE = re.compile(
+    r'File "([^"]+)", line (\d+)(?:, in (.+))?'
+    r'(?:\n[ \t]*(?!File ")(\S[^\n]*))?'
+)
+
+# Pattern: ErrorType: error message
+_ERROR_RE = re.compile(r'(\w+(?:Error|Exception|Warning)): (.+?)(?:\n|$)')
+
+_FRAMEWORK_RES = {
+    'django': re.compile(r'django[/\\]', re.IGNORECASE),
+    'flask': re.compile(r'flask[/\\]', re.IGNORECASE),
+    'fastapi': re.compile(r'fastapi[/\\]', re.IGNORECASE),
+    'pytest': re.compile(r'pytest|_pytest', re.IGNORECASE),
+    'sqlalchemy': re.compile(r'sqlalchemy[/\\]', re.IGNORECASE),
+}
+
 
 class PythonParser(BaseParser):
     """
@@ -22,19 +52,18 @@ class PythonParser(BaseParser):
     
     def can_parse(self, error_log: str) -> float:
         """Detect if this is a Python error"""
-        indicators = [
-            (r'Traceback \(most recent call last\)', 0.4),
-            (r'File ".*\.py", line \d+', 0.3),
-            (r'(Error|Exception):', 0.2),
-            (r'(raise|def|class|import)\s+', 0.1),
-        ]
-        
         score = 0.0
-        for pattern, weight in indicators:
-            if re.search(pattern, error_log):
-                score += weight
-        
-        return min(score, 1.0)
+        seen = set()
+        for match in _INDICATOR_RE.finditer(error_log):
+            group = match.lastgroup
+            if group not in seen:
+                seen.add(group)
+                score += _INDICATOR_WEIGHTS[group]
+                if score >= 1.0:
+                    # Saturated - stop scanning the rest of the log
+                    return 1.0
+
+        return score
     
     def parse(self, error_log: str) -> ParsedError:
         """Parse Python traceback"""
@@ -57,63 +86,49 @@ class PythonParser(BaseParser):
     
     def _extract_stack_frames(self, error_log: str) -> list[StackFrame]:
         """Extract stack frames from traceback"""
+        # Cheap substring prefilter: no "File \"" anywhere means the
+        # frame regex cannot match, so skip the engine entirely
+        if 'File "' not in error_log:
+            return []
+
         frames = []
-        
-        # Pattern: File "path/file.py", line 42, in function_name
-        frame_pattern = r'File "([^"]+)", line (\d+)(?:, in (.+))?'
-        
-        # Also capture the code snippet (next line after File line)
-        lines = error_log.split('\n')
-        
-        for i, line in enumerate(lines):
-            match = re.search(frame_pattern, line)
-            if match:
-                file_path = match.group(1)
-                line_num = int(match.group(2))
-                function = match.group(3).strip() if match.group(3) else None
-                
-                # Try to get code snippet (usually on next line)
-                code_snippet = None
-                if i + 1 < len(lines):
-                    next_line = lines[i + 1].strip()
-                    if next_line and not next_line.startswith('File'):
-                        code_snippet = next_line
-                
-                frames.append(StackFrame(
-                    file_path=file_path,
-                    line=line_num,
-                    function=function,
-                    code_snippet=code_snippet
-                ))
-        
+
+        # One C-engine pass over the whole log instead of a Python
+        # loop re-running the regex per line
+        for match in _FRAME_RE.finditer(error_log):
+            function = match.group(3)
+            code_snippet = match.group(4)
+            frames.append(StackFrame(
+                file_path=match.group(1),
+                line=int(match.group(2)),
+                function=function.strip() if function else None,
+                code_snippet=code_snippet.strip() if code_snippet else None
+            ))
+
         return frames
     
     def _extract_error_info(self, error_log: str) -> dict:
         """Extract error type and message"""
-        # Pattern: ErrorType: error message
-        error_pattern = r'(\w+(?:Error|Exception|Warning)): (.+?)(?:\n|$)'
-        
-        match = re.search(error_pattern, error_log)
+        match = _ERROR_RE.search(error_log)
         if match:
             return {
                 'error_type': match.group(1),
                 'message': match.group(2).strip()
             }
         
-        # Fallback: try to get last non-empty line
-        lines = [l.strip() for l in error_log.split('\n') if l.strip()]
-        if lines:
-            last_line = lines[-1]
-            if ':' in last_line:
-                parts = last_line.split(':', 1)
-                return {
-                    'error_type': parts[0].strip(),
-                    'message': parts[1].strip()
-                }
-        
+        # Fallback: last non-empty line, found without splitting the
+        # whole log into a list of substrings
+        last_line = error_log.rstrip().rsplit('\n', 1)[-1].strip()
+        if ':' in last_line:
+            parts = last_line.split(':', 1)
+            return {
+                'error_type': parts[0].strip(),
+                'message': parts[1].strip()
+            }
+
         return {
             'error_type': 'UnknownError',
-            'message': error_log.split('\n')[-1][:200]
+            'message': last_line[:200]
         }
     
     def _categorize_error(self, error_type: str, error_log: str) -> str:
@@ -133,16 +148,8 @@ class PythonParser(BaseParser):
     
     def _detect_framework(self, error_log: str) -> Optional[str]:
         """Detect Python framework from traceback"""
-        frameworks = {
-            'django': r'django[/\\]',
-            'flask': r'flask[/\\]',
-            'fastapi': r'fastapi[/\\]',
-            'pytest': r'pytest|_pytest',
-            'sqlalchemy': r'sqlalchemy[/\\]',
-        }
-        
-        for framework, pattern in frameworks.items():
-            if re.search(pattern, error_log, re.IGNORECASE):
+        for framework, pattern in _FRAMEWORK_RES.items():
+            if pattern.search(error_log):
                 return framework
         
         return None
@@ -7,6 +7,22 @@ import re
 from typing import Optional
 from .base_parser import BaseParser, ParsedError, StackFrame
 
+# Compiled once at import; see python_parser for rationale
+_INDICATOR_RE = re.compile(
+    r'(?P<ext>jsx|tsx)'
+    r'|(?P<react>React|Component|Hook)'
+    r'|(?P<bundler>(?:webpack|vite).*compiled)'
+    r'|(?P<module>Module parse failed)'
+    r'|(?P<syntax>SyntaxError:.*Unexpected token)',
+    re.IGNORECASE
+)
+_INDICATOR_WEIGHTS = {
+    'ext': 0.2, 'react': 0.2, 'bundler': 0.2, 'module': 0.2, 'syntax': 0.2
+}
+
+# Pattern: ./src/Component.jsx:10:5
+_LOCATION_RE = re.compile(r'(\.?/[^\s:]+\.(jsx|tsx|js|ts)):(\d+):(\d+)')
+
 
 class ReactParser(BaseParser):
     """
@@ -21,20 +37,18 @@ class ReactParser(BaseParser):
     
     def can_parse(self, error_log: str) -> float:
         """Detect if this is a React error"""
-        indicators = [
-            (r'(jsx|tsx)', 0.2),
-            (r'(React|Component|Hook)', 0.2),
-            (r'(webpack|vite).*compiled', 0.2),
-            (r'Module parse failed', 0.2),
-            (r'SyntaxError:.*Unexpected token', 0.2),
-        ]
-        
         score = 0.0
-        for pattern, weight in indicators:
-            if re.search(pattern, error_log, re.IGNORECASE):
-                score += weight
-        
-        return min(score, 1.0)
+        seen = set()
+        for match in _INDICATOR_RE.finditer(error_log):
+            group = match.lastgroup
+            if group not in seen:
+                seen.add(group)
+                score += _INDICATOR_WEIGHTS[group]
+                if score >= 1.0:
+                    # Saturated - stop scanning the rest of the log
+                    return 1.0
+
+        return score
     
     def parse(self, error_log: str) -> ParsedError:
         """Parse React error"""
@@ -57,25 +71,16 @@ class ReactParser(BaseParser):
     
     def _extract_errors(self, error_log: str) -> list[StackFrame]:
         """Extract error locations"""
-        frames = []
-        
-        # Pattern: ./src/Component.jsx:10:5
-        pattern = r'(\.?/[^\s:]+\.(jsx|tsx|js|ts)):(\d+):(\d+)'
-        
-        for line in error_log.split('\n'):
-            match = re.search(pattern, line)
-            if match:
-                file_path = match.group(1)
-                line_num = int(match.group(3))
-                column = int(match.group(4))
-                
-                frames.append(StackFrame(
-                    file_path=file_path,
-                    line=line_num,
-                    column=column
-                ))
-        
-        return frames
+        # One C-engine pass over the whole log (the pattern can't
+        # span lines, so per-line scanning bought nothing)
+        return [
+            StackFrame(
+                file_path=match.group(1),
+                line=int(match.group(3)),
+                column=int(match.group(4))
+            )
+            for match in _LOCATION_RE.finditer(error_log)
+        ]
     
     def _extract_error_info(self, error_log: str) -> dict:
         """Extract error type and message"""
@@ -98,7 +103,7 @@ class ReactParser(BaseParser):
         else:
             return {
                 'error_type': 'BuildError',
-                'message': error_log.split('\n')[0][:200]
+                'message': error_log.partition('\n')[0][:200]
             }
     
     def _categorize_error(self, error_type: str, error_log: str) -> str:
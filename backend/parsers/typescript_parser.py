@@ -7,6 +7,17 @@ import re
 from typing import Optional
 from .base_parser import BaseParser, ParsedError, StackFrame
 
+# Compiled once at import; see python_parser for rationale
+_INDICATOR_RE = re.compile(
+    r'(?P<loc>\.ts\(\d+,\d+\):)'
+    r'|(?P<code>error TS\d+:)'
+    r'|(?P<assign>Type .+ is not assignable to type)'
+)
+_INDICATOR_WEIGHTS = {'loc': 0.4, 'code': 0.4, 'assign': 0.2}
+
+# Pattern: file.ts(line,col): error TS####: message
+_ERROR_RE = re.compile(r'([^\s]+\.tsx?)\((\d+),(\d+)\): error (TS\d+): (.+)')
+
 
 class TypeScriptParser(BaseParser):
     """
@@ -20,18 +31,18 @@ class TypeScriptParser(BaseParser):
     
     def can_parse(self, error_log: str) -> float:
         """Detect if this is a TypeScript error"""
-        indicators = [
-            (r'\.ts\(\d+,\d+\):', 0.4),
-            (r'error TS\d+:', 0.4),
-            (r'Type .+ is not assignable to type', 0.2),
-        ]
-        
         score = 0.0
-        for pattern, weight in indicators:
-            if re.search(pattern, error_log):
-                score += weight
-        
-        return min(score, 1.0)
+        seen = set()
+        for match in _INDICATOR_RE.finditer(error_log):
+            group = match.lastgroup
+            if group not in seen:
+                seen.add(group)
+                score += _INDICATOR_WEIGHTS[group]
+                if score >= 1.0:
+                    # Saturated - stop scanning the rest of the log
+                    return 1.0
+
+        return score
     
     def parse(self, error_log: str) -> ParsedError:
         """Parse TypeScript error"""
@@ -60,26 +71,19 @@ class TypeScriptParser(BaseParser):
     
     def _extract_errors(self, error_log: str) -> list[StackFrame]:
         """Extract TypeScript errors"""
-        frames = []
-        
-        # Pattern: file.ts(line,col): error TS####: message
-        pattern = r'([^\s]+\.tsx?)\((\d+),(\d+)\): error (TS\d+): (.+)'
-        
-        for line in error_log.split('\n'):
-            match = re.search(pattern, line)
-            if match:
-                file_path = match.group(1)
-                line_num = int(match.group(2))
-                column = int(match.group(3))
-                error_code = match.group(4)
-                message = match.group(5)
-                
-                frames.append(StackFrame(
-                    file_path=file_path,
-                    line=line_num,
-                    column=column,
-                    function=None,
-                    code_snippet=f"{error_code}: {message}"
-                ))
-        
-        return frames
+        # Cheap substring prefilter before invoking the regex engine
+        if 'error TS' not in error_log:
+            return []
+
+        # One C-engine pass over the whole log (the pattern can't
+        # span lines, so per-line scanning bought nothing)
+        return [
+            StackFrame(
+                file_path=match.group(1),
+                line=int(match.group(2)),
+                column=int(match.group(3)),
+                function=None,
+                code_snippet=f"{match.group(4)}: {match.group(5)}"
+            )
+            for match in _ERROR_RE.finditer(error_log)
+        ]
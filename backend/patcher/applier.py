@@ -3,8 +3,8 @@ Patch Applier
 Applies code patches safely to files
 """
 
+import os
 import tempfile
-import shutil
 from pathlib import Path
 from typing import Tuple, Optional
 
@@ -122,8 +122,11 @@ class PatchApplier:
                 temp_file.write(new_content)
                 temp_path = temp_file.name
             
-            # Atomic rename
-            shutil.move(temp_path, file_path)
+            # Atomic rename - the temp file lives in the target's
+            # directory, so this is guaranteed same-filesystem and is
+            # a single rename(2) (shutil.move stats and branches, and
+            # falls back to copy+unlink across filesystems)
+            os.replace(temp_path, file_path)
             
             # Record in history
             fix_id = self.history_tracker.add_fix(
@@ -140,6 +143,129 @@ class PatchApplier:
             self.backup_manager.restore_backup(backup_path, file_path)
             return False, f"Failed to apply patch: {e}"
     
+    def apply_patches(
+        self,
+        file_path: str,
+        patches: list,
+        language: str,
+        dry_run: bool = False
+    ) -> Tuple[bool, str]:
+        """
+        Apply several patches to one file in a single pass
+
+        apply_patch re-reads, re-validates, re-backs-up and rewrites
+        the file per hunk; when a fix produces several hunks for the
+        same file this reads once, locates every hunk, splices them in
+        descending line order, validates the combined result once, and
+        does one backup and one atomic write.
+
+        Args:
+            file_path: Path to file to patch
+            patches: List of (original_snippet, new_snippet) pairs
+            language: Programming language
+            dry_run: If True, don't actually modify file
+
+        Returns:
+            Tuple of (success, message)
+        """
+        if not patches:
+            return False, "No patches to apply"
+
+        file_path_obj = Path(file_path)
+
+        if not file_path_obj.exists():
+            return False, f"File not found: {file_path}"
+
+        try:
+            with open(file_path_obj, 'r', encoding='utf-8') as f:
+                current_content = f.read()
+        except Exception as e:
+            return False, f"Failed to read file: {e}"
+
+        # Locate every hunk against the original content
+        located = []
+        skipped = 0
+        for original_snippet, new_snippet in patches:
+            match = self.fuzzy_matcher.match_with_context(
+                original_snippet,
+                current_content,
+                context_lines=2
+            )
+            if match:
+                start_line, end_line, _similarity = match
+                located.append((start_line, end_line, original_snippet, new_snippet))
+            else:
+                skipped += 1
+
+        if not located:
+            return False, "Could not find matching code for any patch"
+
+        # Splice bottom-up so earlier hunks' line numbers stay valid;
+        # overlapping hunks are rejected rather than applied in a
+        # guessed order
+        located.sort(key=lambda item: item[0], reverse=True)
+        prev_start = None
+        for start_line, end_line, _orig, _new in located:
+            if prev_start is not None and end_line > prev_start:
+                return False, "Patches overlap; apply them individually"
+            prev_start = start_line
+
+        lines = current_content.split('\n')
+        for start_line, end_line, _orig, new_snippet in located:
+            lines[start_line:end_line] = [new_snippet]
+        new_content = '\n'.join(lines)
+
+        # Validate the combined result once
+        is_valid, error_msg = self.validator.validate_file_after_patch(
+            file_path,
+            new_content,
+            language
+        )
+
+        if not is_valid:
+            return False, f"Validation failed: {error_msg}"
+
+        if dry_run:
+            return True, f"Dry run successful ({len(located)} patch(es), {skipped} unmatched)"
+
+        # One backup covers the whole batch
+        try:
+            backup_path = self.backup_manager.create_backup(file_path)
+        except Exception as e:
+            return False, f"Failed to create backup: {e}"
+
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode='w',
+                encoding='utf-8',
+                dir=file_path_obj.parent,
+                delete=False
+            ) as temp_file:
+                temp_file.write(new_content)
+                temp_path = temp_file.name
+
+            os.replace(temp_path, file_path)
+
+            # Record each hunk in history (all share the one backup)
+            fix_ids = [
+                self.history_tracker.add_fix(
+                    file_path=file_path,
+                    original_snippet=orig,
+                    new_snippet=new,
+                    backup_path=backup_path
+                )
+                for _start, _end, orig, new in located
+            ]
+
+            message = f"Successfully applied {len(fix_ids)} patch(es) (fix IDs: {', '.join(fix_ids)})"
+            if skipped:
+                message += f"; {skipped} unmatched"
+            return True, message
+
+        except Exception as e:
+            self.backup_manager.restore_backup(backup_path, file_path)
+            return False, f"Failed to apply patches: {e}"
+
     def undo_last_fix(self) -> Tuple[bool, str]:
         """
         Undo the most recent fix
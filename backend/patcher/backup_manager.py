@@ -8,6 +8,17 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+try:
+    import fcntl
+except ImportError:  # not a POSIX platform
+    fcntl = None
+
+# FICLONE from linux/fs.h: asks the filesystem to share the source's
+# extents instead of duplicating them, so backing up a file on btrfs/XFS
+# is O(1) regardless of size. Harmlessly rejected (EOPNOTSUPP/EINVAL)
+# elsewhere, which drops us to a regular copy.
+_FICLONE = 0x40049409
+
 
 class BackupManager:
     """
@@ -54,10 +65,30 @@ class BackupManager:
         backup_path = backup_subdir / backup_name
         
         # Copy file
-        shutil.copy2(source, backup_path)
-        
+        self._fast_copy(source, backup_path)
+
         return str(backup_path)
-    
+
+    def _fast_copy(self, source: Path, backup_path: Path):
+        """
+        Copy source to backup_path, reflinking when the filesystem allows
+
+        Tries a copy-on-write clone first (instant, no data copied);
+        falls back to shutil.copy2 on filesystems without reflink
+        support or on non-Linux platforms.
+        """
+        if fcntl is not None:
+            try:
+                with open(source, 'rb') as src, open(backup_path, 'wb') as dst:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                shutil.copystat(source, backup_path)
+                return
+            except OSError:
+                # ext4, tmpfs, cross-device, etc. - clone not possible
+                pass
+
+        shutil.copy2(source, backup_path)
+
     def restore_backup(self, backup_path: str, original_path: str) -> bool:
         """
         Restore a file from backup
@@ -4,6 +4,7 @@ Tracks all applied fixes for undo and audit
 """
 
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
@@ -13,15 +14,16 @@ class HistoryTracker:
     """
     Tracks history of applied fixes
     """
-    
+
     def __init__(self, history_file: str = ".fix-error-history.json"):
         """
         Initialize history tracker
-        
+
         Args:
             history_file: Path to history file
         """
         self.history_file = Path(history_file)
+        self._lock = threading.Lock()  # Serialize writes when fixes apply in parallel
         self._ensure_history_file()
     
     def _ensure_history_file(self):
@@ -63,24 +65,25 @@ class HistoryTracker:
         Returns:
             Fix ID
         """
-        history = self._load_history()
-        
-        if fix_id is None:
-            fix_id = f"fix_{len(history) + 1}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
-        
-        entry = {
-            "fix_id": fix_id,
-            "timestamp": datetime.now().isoformat(),
-            "file_path": file_path,
-            "original_snippet": original_snippet,
-            "new_snippet": new_snippet,
-            "backup_path": backup_path,
-            "reverted": False
-        }
-        
-        history.append(entry)
-        self._save_history(history)
-        
+        with self._lock:
+            history = self._load_history()
+
+            if fix_id is None:
+                fix_id = f"fix_{len(history) + 1}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+
+            entry = {
+                "fix_id": fix_id,
+                "timestamp": datetime.now().isoformat(),
+                "file_path": file_path,
+                "original_snippet": original_snippet,
+                "new_snippet": new_snippet,
+                "backup_path": backup_path,
+                "reverted": False
+            }
+
+            history.append(entry)
+            self._save_history(history)
+
         return fix_id
     
     def get_fix(self, fix_id: str) -> Optional[Dict]:
@@ -100,14 +103,15 @@ class HistoryTracker:
     
     def mark_reverted(self, fix_id: str) -> bool:
         """Mark a fix as reverted"""
-        history = self._load_history()
-        
-        for entry in history:
-            if entry["fix_id"] == fix_id:
-                entry["reverted"] = True
-                self._save_history(history)
-                return True
-        
+        with self._lock:
+            history = self._load_history()
+
+            for entry in history:
+                if entry["fix_id"] == fix_id:
+                    entry["reverted"] = True
+                    self._save_history(history)
+                    return True
+
         return False
     
     def get_stats(self) -> Dict:
@@ -9,6 +9,19 @@ from pathlib import Path
 # Read README
 readme = Path("README.md").read_text() if Path("README.md").exists() else ""
 
+# Optionally compile the import analyzer (a tight pure-Python hot path)
+# with Cython. The module stays plain Python for anyone without Cython -
+# the annotations it relies on are ordinary PEP 526 hints.
+try:
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["backend/context/import_analyzer.py"],
+        language_level=3,
+    )
+except ImportError:
+    ext_modules = []
+
 setup(
     name="rootcauseai",
     version="0.1.0",
@@ -19,6 +32,7 @@ setup(
     author_email="your.email@example.com",
     url="https://github.com/yourusername/ai-error-fixer",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "langchain-core>=0.3.15",
         "langchain-google-genai>=2.0.5",
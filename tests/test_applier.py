@@ -0,0 +1,118 @@
+"""
+Unit Tests for Batch Patch Application
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.patcher.applier import PatchApplier
+
+
+SOURCE = """def first():
+    return 1
+
+
+def second():
+    return 2
+
+
+def third():
+    return 3
+"""
+
+
+def _make_applier(tmp_path):
+    """Build an applier whose backups and history stay in tmp_path"""
+    return PatchApplier(
+        backup_dir=str(tmp_path / ".backup"),
+        history_file=str(tmp_path / ".history.json")
+    )
+
+
+def test_apply_patches_multiple_hunks(tmp_path):
+    """Test two non-overlapping hunks applied in one pass"""
+    target = tmp_path / "module.py"
+    target.write_text(SOURCE)
+    applier = _make_applier(tmp_path)
+
+    success, message = applier.apply_patches(
+        str(target),
+        [
+            ("def first():\n    return 1", "def first():\n    return 10"),
+            ("def third():\n    return 3", "def third():\n    return 30"),
+        ],
+        language="python"
+    )
+
+    assert success, message
+    content = target.read_text()
+    assert "return 10" in content
+    assert "return 30" in content
+    assert "return 2" in content  # untouched hunk survives
+
+    # One backup covers the whole batch, but each hunk gets a history entry
+    fixes = applier.history_tracker.get_recent_fixes(count=10)
+    assert len(fixes) == 2
+    assert fixes[0]["backup_path"] == fixes[1]["backup_path"]
+
+
+def test_apply_patches_rejects_overlap(tmp_path):
+    """Test overlapping hunks are refused rather than applied in a guessed order"""
+    target = tmp_path / "module.py"
+    target.write_text(SOURCE)
+    applier = _make_applier(tmp_path)
+
+    success, message = applier.apply_patches(
+        str(target),
+        [
+            ("def first():\n    return 1", "def first():\n    return 10"),
+            ("def first():\n    return 1", "def first():\n    return 100"),
+        ],
+        language="python"
+    )
+
+    assert not success
+    assert "apply them individually" in message
+    assert target.read_text() == SOURCE  # file untouched
+
+
+def test_apply_patches_all_unmatched(tmp_path):
+    """Test failure when no patch matches the file"""
+    target = tmp_path / "module.py"
+    target.write_text(SOURCE)
+    applier = _make_applier(tmp_path)
+
+    success, message = applier.apply_patches(
+        str(target),
+        [("def missing():\n    pass", "def missing():\n    return None")],
+        language="python"
+    )
+
+    assert not success
+    assert "Could not find matching code" in message
+    assert target.read_text() == SOURCE
+
+
+def test_apply_patches_dry_run(tmp_path):
+    """Test dry run reports counts without touching the file"""
+    target = tmp_path / "module.py"
+    target.write_text(SOURCE)
+    applier = _make_applier(tmp_path)
+
+    success, message = applier.apply_patches(
+        str(target),
+        [
+            ("def second():\n    return 2", "def second():\n    return 20"),
+            ("def missing():\n    pass", "def missing():\n    return None"),
+        ],
+        language="python",
+        dry_run=True
+    )
+
+    assert success, message
+    assert "1 patch(es)" in message
+    assert "1 unmatched" in message
+    assert target.read_text() == SOURCE